@@ -15,141 +15,492 @@
 # information, demonstrates Python basics (variables, operators,
 # strings), and prints a formatted Student Profile Card.
 # It also includes an optional feature to save the profile into a text file.
+#
+# Batch mode (no prompts) renders cards for a whole intake from a roster CSV:
+#   python student_profile.py --roster intake.csv --out cards
+#   python student_profile.py --roster intake.csv --out cards --combined --workers 4
+# Roster columns: name, roll_no, program, university, city, age, hobby
+# (card labels such as "Roll No" or "Course" also work as headers).
+# Cards are saved as <roll_no>.txt; roll numbers that would give the same
+# file name (e.g. "A/1" and "A_1") get a -2, -3, ... suffix.
+#
+# Saved cards (single or combined files) can be indexed and searched:
+#   python student_profile.py --scan cards student_profile.txt
+#   python student_profile.py --find program=BCA city=Delhi
+
+
+import argparse
+import csv
+import json
+import os
+import re
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
 
 
 # -----------------------------
-# Welcome Section
+# Profile Card Template
 # -----------------------------
 
-print("\n" + "=" * 60)
-print("Welcome to Student Profile Generator CLI")
-print("=" * 60)
-print("This tool will collect your details and generate your profile card.")
-print("You will also learn Python basics like:")
-print("- Variables\n- Data Types\n- Operators\n- String Functions\n- File Handling\n")
+# Card layout matches student_profile.txt; compiled once and reused per student.
+CARD_FIELDS = [
+    ("Name", "name"),
+    ("Roll No", "roll_no"),
+    ("Course", "program"),
+    ("University", "university"),
+    ("City", "city"),
+    ("Age", "age"),
+    ("Hobby", "hobby"),
+]
+CARD_TEMPLATE = (
+    "STUDENT PROFILE\n" + "-" * 50 + "\n"
+    + "".join(f"{label}: {{{key}}}\n" for label, key in CARD_FIELDS)
+    + "-" * 50
+)
+render_card = CARD_TEMPLATE.format_map
+
+# Roster header -> card field ("Roll No", "roll no", "ROLL_NO" all map to roll_no).
+HEADER_ALIASES = {label.lower().replace(" ", "_"): key for label, key in CARD_FIELDS}
+HEADER_ALIASES.update({key: key for _, key in CARD_FIELDS})
+HEADER_ALIASES.update({"full_name": "name", "roll_number": "roll_no", "course": "program"})
+
+COMBINED_FILE = "student_profiles.txt"
+CHUNK_SIZE = 2000
 
 
 # -----------------------------
-# Task 2: Input & Variables
+# Batch Mode (roster CSV -> profile cards)
 # -----------------------------
 
-full_name = input("Enter your full name: ")
-roll_no = input("Enter your roll number: ")
-program = input("Enter your program (e.g., BCA): ")
-university = input("Enter your university name: ")
-city = input("Enter your city: ")
-
-age = int(input("Enter your age: "))  # type conversion
-hobby = input("Enter your hobby: ")
-
-print("\n Student Data Recorded Successfully!\n")
-
-
-# -----------------------------
-# Task 3: Operators Demonstration
-# -----------------------------
-
-print("=" * 60)
-print("Python Operators Demonstration")
-print("=" * 60)
-
-num1 = float(input("Enter first number: "))
-num2 = float(input("Enter second number: "))
-
-# Arithmetic
-print("\n-- Arithmetic Operations --")
-print(f"{num1} + {num2} = {num1 + num2}")
-print(f"{num1} - {num2} = {num1 - num2}")
-print(f"{num1} * {num2} = {num1 * num2}")
-print(f"{num1} / {num2} = {num1 / num2}")
-print(f"{num1} % {num2} = {num1 % num2}")
-print(f"{num1} ** {num2} = {num1 ** num2}")
-print(f"{num1} // {num2} = {num1 // num2}")
-
-# Assignment
-a = num1
-a += 5
-print("\n-- Assignment Operator Example --")
-print(f"num1 += 5 → {a}")
-
-# Comparison
-print("\n-- Comparison Operators --")
-print(f"{num1} > {num2} : {num1 > num2}")
-print(f"{num1} < {num2} : {num1 < num2}")
-print(f"{num1} == {num2} : {num1 == num2}")
-
-# Logical
-print("\n-- Logical Operators --")
-print(f"({num1} > {num2}) and ({num1} != {num2}) : {(num1 > num2) and (num1 != num2)}")
-
-# Identity
-print("\n-- Identity Operators --")
-print(f"num1 is num2 : {num1 is num2}")
-print(f"num1 is not num2 : {num1 is not num2}")
-
-# Membership
-print("\n-- Membership Operators --")
-sample_string = full_name.lower()
-print(f"'a' in your name? : {'a' in sample_string}")
+def read_roster(path):
+    """Check the roster header now and return a stream of rows as dicts keyed by card field.
+
+    Missing columns raise ValueError here, before any worker is started.
+    """
+    f = open(path, newline="", encoding="utf-8-sig")
+    reader = csv.reader(f)
+    header = next(reader, [])
+    keys = [HEADER_ALIASES.get(h.strip().lower().replace(" ", "_")) for h in header]
+    missing = {key for _, key in CARD_FIELDS} - set(keys)
+    if missing:
+        f.close()
+        raise ValueError(f"Roster is missing columns: {', '.join(sorted(missing))}")
+    return _roster_rows(f, reader, keys)
+
+
+def _roster_rows(f, reader, keys):
+    with f:
+        blank = dict.fromkeys((key for _, key in CARD_FIELDS), "")
+        for row in reader:
+            if row:
+                yield {**blank, **{k: v.strip() for k, v in zip(keys, row) if k}}
+
+
+def safe_filename(roll_no):
+    return re.sub(r"[^\w.-]", "_", roll_no) or "unknown"
+
+
+def unique_filenames(rows):
+    """Pair each row with a card file name, adding -2, -3, ... when names collide.
+
+    safe_filename maps e.g. "A/1" and "A_1" to the same name. Names are compared
+    case-insensitively so cards also stay apart on Windows / macOS.
+    """
+    used = set()
+    for row in rows:
+        base = safe_filename(row["roll_no"])
+        name, n = base, 1
+        while name.casefold() in used:
+            n += 1
+            name = f"{base}-{n}"
+        used.add(name.casefold())
+        yield name, row
+
+
+def render_chunk(args):
+    """Worker: render one chunk of students; returns (count, text).
+
+    With an out_dir the chunk holds (file name, row) pairs and each card is
+    written to <file name>.txt in a single write, with text empty; otherwise
+    it holds rows and the joined cards are returned for the combined file.
+    """
+    items, out_dir = args
+    if out_dir is None:
+        return len(items), "\n\n".join(render_card(row) for row in items)
+    for name, row in items:
+        with open(os.path.join(out_dir, name + ".txt"), "w") as f:
+            f.write(render_card(row))
+    return len(items), ""
+
+
+def chunked(rows, size):
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def bounded_map(pool, fn, tasks, limit):
+    """Like pool.map, but with at most limit tasks in flight.
+
+    pool.map submits every task up front, which would read the whole roster
+    into memory; here the next chunk is only read once an earlier one is done.
+    Results are yielded in order.
+    """
+    pending = deque()
+    for task in tasks:
+        if len(pending) >= limit:
+            yield pending.popleft().result()
+        pending.append(pool.submit(fn, task))
+    while pending:
+        yield pending.popleft().result()
+
+
+def generate_cards(roster, out_dir, combined=False, workers=None):
+    """Render a card for every roster row, one file per roll number or a single combined file."""
+    rows = read_roster(roster)
+    os.makedirs(out_dir, exist_ok=True)
+    if combined:
+        tasks = ((chunk, None) for chunk in chunked(rows, CHUNK_SIZE))
+    else:
+        tasks = ((chunk, out_dir) for chunk in chunked(unique_filenames(rows), CHUNK_SIZE))
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = bounded_map(pool, render_chunk, tasks, 2 * workers)
+        if not combined:
+            return sum(n for n, _ in results)
+
+        count = 0
+        with open(os.path.join(out_dir, COMBINED_FILE), "w", buffering=1 << 20) as f:
+            for n, text in results:
+                f.write(("\n\n" if count else "") + text)
+                count += n
+    return count
 
 
 # -----------------------------
-# Task 4: String Operations
+# Profile Registry (index of saved cards)
 # -----------------------------
 
-print("\n" + "=" * 60)
-print("String Formatting & Methods Demo")
-print("=" * 60)
-
-print("Uppercase name:", full_name.upper())
-print("Lowercase name:", full_name.lower())
-print("Title case name:", full_name.title())
-print("Name length:", len(full_name))
-print("Replace a with @:", full_name.replace("a", "@"))
+REGISTRY_FILE = "profile_registry.json"
+INDEXED_FIELDS = ("program", "university", "city")
+LABEL_TO_KEY = {label: key for label, key in CARD_FIELDS}
+FIELD_KEYS = [key for _, key in CARD_FIELDS]
+
+
+def parse_cards(text):
+    """Yield a dict per STUDENT PROFILE card found in text (one card or a combined file)."""
+    for block in text.split("STUDENT PROFILE")[1:]:
+        card = dict.fromkeys(FIELD_KEYS, "")
+        for line in block.splitlines():
+            label, sep, value = line.partition(": ")
+            if sep and label in LABEL_TO_KEY:
+                card[LABEL_TO_KEY[label]] = value.strip()
+        if card.get("roll_no"):
+            yield card
+
+
+class ProfileRegistry:
+    """Roll-number-indexed store of parsed profile cards.
+
+    Saved as compact rows (card fields in CARD_FIELDS order, then source file)
+    plus a manifest of scanned files with their mtime and size, so a re-scan
+    only parses files that are new or changed. A roll number found in several
+    files keeps one copy per file; the most recently scanned copy is the
+    profile, and it is only dropped once no file contains it. Secondary
+    indexes on program, university and city are rebuilt in memory on load.
+    """
+
+    def __init__(self, path=REGISTRY_FILE):
+        self.path = Path(path)
+        self.profiles = {}      # roll_no -> current card dict
+        self.copies = {}        # roll_no -> {file: card}, in scan order
+        self.files = {}         # file -> [mtime_ns, size, [roll_nos]]
+        self.index = {field: defaultdict(set) for field in INDEXED_FIELDS}
+        if self.path.exists():
+            self.load()
+
+    @staticmethod
+    def _key(value):
+        return value.strip().casefold()
+
+    def _add(self, card, source):
+        copies = self.copies.setdefault(card["roll_no"], {})
+        copies.pop(source, None)
+        copies[source] = card
+        self._update(card["roll_no"])
+
+    def _update(self, roll):
+        """Make the latest remaining copy of roll its profile (or drop it if none is left)."""
+        old = self.profiles.pop(roll, None)
+        if old is not None:
+            for field in INDEXED_FIELDS:
+                rolls = self.index[field].get(self._key(old.get(field, "")))
+                if rolls is not None:
+                    rolls.discard(roll)
+
+        copies = self.copies.get(roll)
+        if not copies:
+            self.copies.pop(roll, None)
+            return
+        card = next(reversed(copies.values()))
+        self.profiles[roll] = card
+        for field in INDEXED_FIELDS:
+            self.index[field][self._key(card.get(field, ""))].add(roll)
+
+    def _drop_file(self, name):
+        for roll in self.files.pop(name, [0, 0, []])[2]:
+            copies = self.copies.get(roll)
+            if copies and copies.pop(name, None) is not None:
+                self._update(roll)
+
+    def scan(self, *paths):
+        """Index .txt cards under paths (files or folders); returns (parsed files, skipped files)."""
+        seen = set()
+        parsed = skipped = 0
+        for path in map(Path, paths):
+            if not path.exists():
+                continue  # its files are dropped below, like any deleted file
+            candidates = path.rglob("*.txt") if path.is_dir() else [path]
+            for file in candidates:
+                name = str(file.resolve())
+                seen.add(name)
+                st = file.stat()
+                entry = self.files.get(name)
+                if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                    skipped += 1
+                    continue
+
+                self._drop_file(name)
+                with open(file, encoding="utf-8", errors="replace") as f:
+                    cards = list(parse_cards(f.read()))
+                for card in cards:
+                    self._add(card, name)
+                self.files[name] = [st.st_mtime_ns, st.st_size, [c["roll_no"] for c in cards]]
+                parsed += 1
+
+        # Files under a scanned folder that have since been deleted.
+        roots = [str(Path(p).resolve()) for p in paths]
+        for name in list(self.files):
+            if name not in seen and any(name.startswith(r) for r in roots) and not Path(name).exists():
+                self._drop_file(name)
+        return parsed, skipped
+
+    def get(self, roll_no):
+        return self.profiles.get(roll_no)
+
+    def find(self, **criteria):
+        """Profiles matching every given program / university / city (case-insensitive)."""
+        sets = []
+        for field, value in criteria.items():
+            if field not in self.index:
+                raise ValueError(f"Can only search by {', '.join(INDEXED_FIELDS)}")
+            sets.append(self.index[field].get(self._key(value), set()))
+        if not sets:
+            return list(self.profiles.values())
+        sets.sort(key=len)
+        rolls = set(sets[0]).intersection(*sets[1:])
+        return [self.profiles[r] for r in sorted(rolls)]
+
+    def save(self):
+        rows = [[card.get(k, "") for k in FIELD_KEYS] + [source]
+                for copies in self.copies.values() for source, card in copies.items()]
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump({"fields": FIELD_KEYS, "files": self.files, "profiles": rows}, f,
+                      separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+    def load(self):
+        with open(self.path) as f:
+            data = json.load(f)
+        self.files = data["files"]
+        for row in data["profiles"]:
+            self._add(dict(zip(data["fields"], row[:-1])), row[-1])
 
 
 # -----------------------------
-# Task 5: Student Profile Card Output
+# Interactive Mode (original assignment flow)
 # -----------------------------
 
-print("\n" + "-" * 60)
-print("          STUDENT PROFILE SYSTEM")
-print("-" * 60)
+def interactive():
+    # -----------------------------
+    # Welcome Section
+    # -----------------------------
+
+    print("\n" + "=" * 60)
+    print("Welcome to Student Profile Generator CLI")
+    print("=" * 60)
+    print("This tool will collect your details and generate your profile card.")
+    print("You will also learn Python basics like:")
+    print("- Variables\n- Data Types\n- Operators\n- String Functions\n- File Handling\n")
+
 
-print(f"Name:            {full_name}")
-print(f"Roll No:         {roll_no}")
-print(f"Course:          {program}")
-print(f"University:      {university}")
-print(f"City:            {city}")
-print(f"Age:             {age}")
-print(f"Hobby:           {hobby}")
+    # -----------------------------
+    # Task 2: Input & Variables
+    # -----------------------------
 
-print("-" * 60)
-print("Welcome to Python Programming!")
-print("-" * 60)
+    full_name = input("Enter your full name: ")
+    roll_no = input("Enter your roll number: ")
+    program = input("Enter your program (e.g., BCA): ")
+    university = input("Enter your university name: ")
+    city = input("Enter your city: ")
+
+    age = int(input("Enter your age: "))  # type conversion
+    hobby = input("Enter your hobby: ")
 
+    print("\n Student Data Recorded Successfully!\n")
+
+
+    # -----------------------------
+    # Task 3: Operators Demonstration
+    # -----------------------------
 
-# -----------------------------
-#  Task 6: Save Profile (Bonus Task)
-# -----------------------------
+    print("=" * 60)
+    print("Python Operators Demonstration")
+    print("=" * 60)
 
-save = input("\nDo you want to save your profile? (yes/no): ").lower()
-
-if save == "yes":
-    with open("student_profile.txt", "w") as file:
-        file.write("STUDENT PROFILE\n")
-        file.write("-" * 50 + "\n")
-        file.write(f"Name: {full_name}\n")
-        file.write(f"Roll No: {roll_no}\n")
-        file.write(f"Course: {program}\n")
-        file.write(f"University: {university}\n")
-        file.write(f"City: {city}\n")
-        file.write(f"Age: {age}\n")
-        file.write(f"Hobby: {hobby}\n")
-        file.write("-" * 50)
-
-    print("\n Profile saved to student_profile.txt")
-else:
-    print("\n Profile not saved.")
-
-print("\n Thank you for using Student Profile CLI!")
+    num1 = float(input("Enter first number: "))
+    num2 = float(input("Enter second number: "))
+
+    # Arithmetic
+    print("\n-- Arithmetic Operations --")
+    print(f"{num1} + {num2} = {num1 + num2}")
+    print(f"{num1} - {num2} = {num1 - num2}")
+    print(f"{num1} * {num2} = {num1 * num2}")
+    print(f"{num1} / {num2} = {num1 / num2}")
+    print(f"{num1} % {num2} = {num1 % num2}")
+    print(f"{num1} ** {num2} = {num1 ** num2}")
+    print(f"{num1} // {num2} = {num1 // num2}")
+
+    # Assignment
+    a = num1
+    a += 5
+    print("\n-- Assignment Operator Example --")
+    print(f"num1 += 5 → {a}")
+
+    # Comparison
+    print("\n-- Comparison Operators --")
+    print(f"{num1} > {num2} : {num1 > num2}")
+    print(f"{num1} < {num2} : {num1 < num2}")
+    print(f"{num1} == {num2} : {num1 == num2}")
+
+    # Logical
+    print("\n-- Logical Operators --")
+    print(f"({num1} > {num2}) and ({num1} != {num2}) : {(num1 > num2) and (num1 != num2)}")
+
+    # Identity
+    print("\n-- Identity Operators --")
+    print(f"num1 is num2 : {num1 is num2}")
+    print(f"num1 is not num2 : {num1 is not num2}")
+
+    # Membership
+    print("\n-- Membership Operators --")
+    sample_string = full_name.lower()
+    print(f"'a' in your name? : {'a' in sample_string}")
+
+
+    # -----------------------------
+    # Task 4: String Operations
+    # -----------------------------
+
+    print("\n" + "=" * 60)
+    print("String Formatting & Methods Demo")
+    print("=" * 60)
+
+    print("Uppercase name:", full_name.upper())
+    print("Lowercase name:", full_name.lower())
+    print("Title case name:", full_name.title())
+    print("Name length:", len(full_name))
+    print("Replace a with @:", full_name.replace("a", "@"))
+
+
+    # -----------------------------
+    # Task 5: Student Profile Card Output
+    # -----------------------------
+
+    print("\n" + "-" * 60)
+    print("          STUDENT PROFILE SYSTEM")
+    print("-" * 60)
+
+    print(f"Name:            {full_name}")
+    print(f"Roll No:         {roll_no}")
+    print(f"Course:          {program}")
+    print(f"University:      {university}")
+    print(f"City:            {city}")
+    print(f"Age:             {age}")
+    print(f"Hobby:           {hobby}")
+
+    print("-" * 60)
+    print("Welcome to Python Programming!")
+    print("-" * 60)
+
+
+    # -----------------------------
+    #  Task 6: Save Profile (Bonus Task)
+    # -----------------------------
+
+    save = input("\nDo you want to save your profile? (yes/no): ").lower()
+
+    if save == "yes":
+        with open("student_profile.txt", "w") as file:
+            file.write(render_card({
+                "name": full_name, "roll_no": roll_no, "program": program,
+                "university": university, "city": city, "age": age, "hobby": hobby,
+            }))
+
+        print("\n Profile saved to student_profile.txt")
+    else:
+        print("\n Profile not saved.")
+
+    print("\n Thank you for using Student Profile CLI!")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Student Profile Card generator")
+    parser.add_argument("--roster", help="CSV of students; generates cards without prompts")
+    parser.add_argument("--out", default="profiles", help="output folder for batch cards")
+    parser.add_argument("--combined", action="store_true", help=f"write all cards into {COMBINED_FILE}")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--scan", nargs="+", metavar="PATH", help="index saved cards (files or folders)")
+    parser.add_argument("--find", nargs="*", metavar="FIELD=VALUE",
+                        help="search the registry by program / university / city")
+    parser.add_argument("--registry", default=REGISTRY_FILE, help="registry file for --scan / --find")
+    args = parser.parse_args()
+
+    if args.scan or args.find is not None:
+        registry = ProfileRegistry(args.registry)
+        if args.scan:
+            start = time.perf_counter()
+            parsed, skipped = registry.scan(*args.scan)
+            registry.save()
+            print(f"Indexed {len(registry.profiles)} profiles: {parsed} files parsed, "
+                  f"{skipped} unchanged ({time.perf_counter() - start:.2f}s)")
+        if args.find is not None:
+            bad = [item for item in args.find if "=" not in item]
+            if bad:
+                parser.error(f"--find expects FIELD=VALUE, got {bad[0]!r}")
+            criteria = dict(item.split("=", 1) for item in args.find)
+            start = time.perf_counter()
+            try:
+                matches = registry.find(**criteria)
+            except ValueError as e:
+                parser.error(str(e))
+            elapsed = (time.perf_counter() - start) * 1000
+            for card in matches:
+                print(f"{card['roll_no']:<14} {card['name']:<25} {card['program']:<8} {card['city']}")
+            print(f"{len(matches)} matching profiles ({elapsed:.2f} ms)")
+    elif args.roster:
+        start = time.perf_counter()
+        try:
+            count = generate_cards(args.roster, args.out, args.combined, args.workers)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+        print(f"Generated {count} profile cards in {args.out} ({time.perf_counter() - start:.2f}s)")
+    else:
+        interactive()
@@ -3,12 +3,27 @@ Name: Your Name
 Date: 2025
 Project: Library Inventory & Borrowing System (Mini Project - Unit 2)
 """
+import heapq
+from collections import defaultdict, deque
+from datetime import date, timedelta
 
 # ------------------------------
 # Global Data Storage
 # ------------------------------
 books = {}          # bookID → book details
 borrowed = {}       # student → bookID
+due_dates = {}      # student → due date of their loan
+holds = {}          # bookID → deque of students waiting (FIFO)
+
+LOAN_DAYS = 14
+
+# Due-date scheduler: a min-heap of (due, seq, student, bookID) plus a
+# date → students bucket. Returned loans are left in the heap and skipped
+# when met (lazy deletion), so borrow / return stay O(log n).
+due_heap = []
+due_on = defaultdict(set)
+loan_seq = {}       # student → seq of their current loan's heap entry
+_loan_seq = 0
 
 
 # ------------------------------
@@ -88,6 +103,111 @@ def search_book():
     print()
 
 
+# ------------------------------
+# Loans, Holds & Due-Date Scheduler
+# ------------------------------
+def checkout(student, book_id, today=None):
+    """Lend one copy to student and schedule its due date; returns the due date.
+
+    A student holds one book at a time, so an existing loan raises ValueError
+    rather than being replaced.
+    """
+    global _loan_seq
+    today = today or date.today()
+    if student in borrowed:
+        raise ValueError(f"{student} already has {borrowed[student]} on loan")
+
+    due = today + timedelta(days=LOAN_DAYS)
+    borrowed[student] = book_id
+    due_dates[student] = due
+    books[book_id]["copies"] -= 1
+
+    _loan_seq += 1
+    loan_seq[student] = _loan_seq
+    heapq.heappush(due_heap, (due, _loan_seq, student, book_id))
+    due_on[due].add(student)
+    if len(due_heap) > 2 * len(borrowed) + 64:
+        _compact_heap()
+    return due
+
+
+def _close_loan(student):
+    book_id = borrowed.pop(student)
+    due = due_dates.pop(student)
+    loan_seq.pop(student, None)
+    due_on[due].discard(student)
+    if not due_on[due]:
+        del due_on[due]
+    return book_id
+
+
+def _is_current(entry):
+    # The seq identifies the loan, so a returned and re-borrowed book is not counted twice.
+    return loan_seq.get(entry[2]) == entry[1]
+
+
+def place_hold(student, book_id):
+    """Join the FIFO hold queue for book_id; returns the position in the queue."""
+    queue = holds.setdefault(book_id, deque())
+    if student not in queue:
+        queue.append(student)
+    return queue.index(student) + 1
+
+
+def checkin(student, book_id, today=None):
+    """Take a copy back and hand it to the next student on hold.
+
+    Students who still have another book on loan are skipped but keep their
+    place in the queue. Returns (next_student, due) when a hold was served,
+    otherwise None (the copy stays on the shelf).
+    """
+    _close_loan(student)
+    books[book_id]["copies"] += 1
+
+    queue = holds.get(book_id, ())
+    for i, next_student in enumerate(queue):
+        if next_student not in borrowed:
+            del queue[i]
+            if not queue:
+                del holds[book_id]
+            return next_student, checkout(next_student, book_id, today)
+    return None
+
+
+def most_overdue(n, today=None):
+    """Up to n loans past due, oldest first, as (student, bookID, due).
+
+    Walks the heap as a tree with a small frontier heap instead of scanning
+    every loan: O(k log k) for k entries visited (stale ones included).
+    """
+    today = today or date.today()
+    result = []
+    frontier = [(due_heap[0], 0)] if due_heap else []
+    while frontier and len(result) < n:
+        entry, i = heapq.heappop(frontier)
+        if entry[0] >= today:
+            break
+        if _is_current(entry):
+            result.append((entry[2], entry[3], entry[0]))
+        for child in (2 * i + 1, 2 * i + 2):
+            if child < len(due_heap):
+                heapq.heappush(frontier, (due_heap[child], child))
+    return result
+
+
+def loans_due_on(day=None):
+    """All loans due on day (default today) as (student, bookID, due)."""
+    day = day or date.today()
+    return [(s, borrowed[s], day) for s in sorted(due_on.get(day, ()))]
+
+
+def _compact_heap():
+    """Drop returned loans from the heap once they outnumber the live ones."""
+    global due_heap
+    due_heap = [e for e in due_heap if _is_current(e)]
+    heapq.heapify(due_heap)
+
+
 # ------------------------------
 # Task 4: Borrow Book
 # ------------------------------
@@ -100,12 +220,18 @@ def borrow_book():
         print("Book does not exist!\n")
         return
 
+    if student in borrowed:
+        print(f"\n{student} must return {borrowed[student]} first!\n")
+        return
+
     if books[book_id]["copies"] > 0:
-        borrowed[student] = book_id
-        books[book_id]["copies"] -= 1
-        print(f"\nBook borrowed successfully by {student}\n")
+        due = checkout(student, book_id)
+        print(f"\nBook borrowed successfully by {student} (due {due})\n")
     else:
-        print("\nNo copies available!\n")
+        print("\nNo copies available!")
+        if input("Place a hold on this book? (yes/no): ").strip().lower() == "yes":
+            position = place_hold(student, book_id)
+            print(f"Hold placed. {student} is #{position} in the queue.\n")
 
 
 # ------------------------------
@@ -117,9 +243,10 @@ def return_book():
     book_id = input("Enter Book ID: ")
 
     if student in borrowed and borrowed[student] == book_id:
-        books[book_id]["copies"] += 1
-        borrowed.pop(student)
+        served = checkin(student, book_id)
         print("\nBook returned successfully!\n")
+        if served:
+            print(f"Hold served: {served[0]} now has {book_id} (due {served[1]})\n")
     else:
         print("\nInvalid return attempt!\n")
 
@@ -128,6 +255,30 @@ def return_book():
     print("Borrowed List:", borrowed_list, "\n")
 
 
+# ------------------------------
+# Overdue & Due-Today Report
+# ------------------------------
+def overdue_report():
+    print("\n--- Overdue Loans ---")
+    n = input("How many to show? (default 10): ").strip()
+    overdue = most_overdue(int(n) if n else 10)
+
+    if overdue:
+        today = date.today()
+        for student, book_id, due in overdue:
+            print(f"{student}\t{book_id}\tdue {due}\t({(today - due).days} days overdue)")
+    else:
+        print("No overdue loans.")
+
+    print("\n--- Due Today ---")
+    due_today = loans_due_on()
+    for student, book_id, _ in due_today:
+        print(f"{student}\t{book_id}")
+    if not due_today:
+        print("Nothing due today.")
+    print()
+
+
 # ------------------------------
 # Menu + Loop (Task 1 & 6)
 # ------------------------------
@@ -139,7 +290,8 @@ def menu():
         print("3. Search Book")
         print("4. Borrow Book")
         print("5. Return Book")
-        print("6. Exit")
+        print("6. Overdue / Due Today")
+        print("7. Exit")
         print("===================================================")
 
         choice = input("Enter your choice: ")
@@ -155,6 +307,8 @@ def menu():
         elif choice == "5":
             return_book()
         elif choice == "6":
+            overdue_report()
+        elif choice == "7":
             print("Exiting the program... Goodbye!")
             break
         else:
@@ -162,4 +316,5 @@ def menu():
 
 
 # Run Program
-menu()
+if __name__ == "__main__":
+    menu()
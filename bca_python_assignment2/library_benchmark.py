@@ -0,0 +1,69 @@
+"""
+Benchmark for the library hold queue and due-date scheduler.
+
+Creates 10^6 active loans with due dates spread over the last and next
+few weeks, then times the overdue / due-today queries and returns that
+serve a hold queue. Compares the top-N overdue query with a full scan.
+
+Run:
+   python library_benchmark.py [loans]
+"""
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+import library
+
+
+def timed(label, fn, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label:<42} {elapsed * 1000:10.3f} ms")
+    return result
+
+
+def main(loans=1_000_000):
+    rng = random.Random(0)
+    today = date.today()
+    n_books = loans // 10
+
+    for i in range(n_books):
+        library.books[f"B{i}"] = {"title": f"Title {i}", "author": "Author", "copies": 10}
+
+    def load():
+        for i in range(loans):
+            # Borrowed between 40 days ago and today -> due from 26 days ago to 14 days ahead.
+            day = today - timedelta(days=rng.randint(0, 40))
+            library.checkout(f"S{i}", f"B{i % n_books}", day)
+    timed(f"checkout x {loans:,}", load)
+
+    overdue = timed("most_overdue(10)", lambda: library.most_overdue(10, today), repeat=100)
+    timed("most_overdue(1000)", lambda: library.most_overdue(1000, today), repeat=10)
+    due = timed("loans_due_on(today)", lambda: library.loans_due_on(today), repeat=10)
+
+    def full_scan():
+        late = [(d, s) for s, d in library.due_dates.items() if d < today]
+        return sorted(late)[:10]
+    scan = timed("full scan + sort (for comparison)", full_scan)
+    assert [d for d, _ in scan] == [d for _, _, d in overdue]
+
+    # Returns that each serve a waiting hold on a different title.
+    borrower = {}
+    for student, book_id in library.borrowed.items():
+        borrower.setdefault(book_id, student)
+    titles = [f"B{i}" for i in range(min(1000, n_books))]
+    for i, book_id in enumerate(titles):
+        library.place_hold(f"H{i}", book_id)
+    served = timed(f"{len(titles)} returns serving holds",
+                   lambda: [library.checkin(borrower[b], b, today) for b in titles])
+    assert all(served)
+
+    print(f"\nActive loans: {len(library.borrowed):,}, overdue shown: {len(overdue)}, "
+          f"due today: {len(due):,}, heap entries: {len(library.due_heap):,}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
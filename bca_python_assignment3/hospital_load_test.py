@@ -0,0 +1,100 @@
+"""
+Load test for multi-desk (shared) mode of hospital_manager.py
+
+Seeds a records file with a realistic number of patients, starts several
+desk processes that all commit admissions, discharges and doctor assignments
+to it, then reports operations per second and the conflict rate (commits
+that found their copy stale). Desks load the records before the timed part
+starts, so only the concurrent commits are measured.
+
+Usage:
+    python hospital_load_test.py [desks] [ops_per_desk] [seed_patients]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from multiprocessing import Barrier, Pool
+from pathlib import Path
+
+from hospital_manager import Doctor, HospitalManagement, Patient
+
+SPECIALIZATIONS = ["Cardiology", "Orthopedic", "Neurology"]
+
+
+def seed_records(data_file, patients, doctors=300):
+    HMS = HospitalManagement(data_file, shared=True)
+    rng = random.Random(0)
+
+    def op():
+        for i in range(doctors):
+            HMS.register_doctor(Doctor(f"Dr. {i}", f"D{i}", SPECIALIZATIONS[i % len(SPECIALIZATIONS)]))
+        for i in range(patients):
+            status = "Admitted" if rng.random() < 0.3 else "Discharged"
+            HMS.register_patient(Patient(f"Seed Patient {i}", f"S{i}", rng.randint(1, 90), "Flu",
+                                         status, f"D{rng.randrange(doctors)}"))
+    HMS.commit(op)
+
+
+def init_desk(barrier):
+    global start_barrier
+    start_barrier = barrier
+
+
+def desk_worker(args):
+    """One front desk: a random mix of admit / auto-assign / discharge commits."""
+    data_file, desk, ops = args
+    rng = random.Random(desk)
+    HMS = HospitalManagement(data_file, shared=True)
+    HMS.refresh()
+    admitted = []
+    admissions = 0
+    start_barrier.wait()
+    start = time.perf_counter()
+
+    for n in range(ops):
+        choice = rng.random()
+        if choice < 0.5 or not admitted:
+            pid = f"P{desk}-{n}"
+            HMS.commit(lambda: HMS.register_patient(Patient(f"Patient {desk}-{n}", pid, rng.randint(1, 90), "Flu")))
+            admitted.append(pid)
+            admissions += 1
+        elif choice < 0.8:
+            pid = rng.choice(admitted)
+            HMS.commit(lambda: HMS.auto_assign(pid, rng.choice(SPECIALIZATIONS)))
+        else:
+            pid = admitted.pop(rng.randrange(len(admitted)))
+            HMS.commit(lambda: HMS.mark_discharged(pid))
+
+    return HMS.commits, HMS.conflicts, admissions, time.perf_counter() - start
+
+
+def run(desks=4, ops=200, seed=100_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = Path(tmp) / "hospital_records.json"
+        seed_records(data_file, seed)
+
+        with Pool(desks, initializer=init_desk, initargs=(Barrier(desks),)) as pool:
+            results = pool.map(desk_worker, [(data_file, d, ops) for d in range(desks)])
+        elapsed = max(r[3] for r in results)
+
+        commits = sum(r[0] for r in results)
+        conflicts = sum(r[1] for r in results)
+        admissions = sum(r[2] for r in results) + seed
+
+        final = HospitalManagement(data_file, shared=True)
+        final.refresh()
+
+    print(f"Seeded patients: {seed:,}, desks: {desks}, operations: {commits}")
+    print(f"Elapsed: {elapsed:.2f}s ({commits / elapsed:,.0f} ops/s)")
+    print(f"Conflicts: {conflicts} ({conflicts / commits:.1%} of commits)")
+    print(f"Patients in final file: {len(final.patients)} (admitted by desks: {admissions}, "
+          f"lost updates: {admissions - len(final.patients)})")
+
+
+if __name__ == "__main__":
+    desks = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    ops = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 100_000
+    run(desks, ops, seed)
@@ -1,4 +1,12 @@
+import csv
+import heapq
 import json
+import os
+import sys
+import time
+from collections import Counter, defaultdict, namedtuple
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
 
 # -------------------------
@@ -64,14 +72,463 @@ class Doctor(Person):
         }
 
 
+# -------------------------
+# Patient Search Index
+# -------------------------
+def _trigrams(text):
+    """Lowercased 3-character substrings of text (the whole text if shorter)."""
+    text = text.lower()
+    if len(text) < 3:
+        return {text}
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _short_grams(text):
+    """Lowercased 1- and 2-character substrings of text."""
+    text = text.lower()
+    return set(text) | {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class PatientIndex:
+    """Maintained lookup tables over patients so searches avoid a full scan.
+
+    - grams: trigram of a patient's ID / name -> patient IDs
+    - short: 1- and 2-character substring -> patient IDs (for short keywords)
+    - status / disease / doctor: field value -> patient IDs
+    """
+    def __init__(self):
+        self.grams = defaultdict(set)
+        self.short = defaultdict(set)
+        self.status = defaultdict(set)
+        self.disease = defaultdict(set)
+        self.doctor = defaultdict(set)
+
+    @staticmethod
+    def _remove(table, key, pid):
+        ids = table.get(key)
+        if ids is not None:
+            ids.discard(pid)
+            if not ids:
+                del table[key]
+
+    def add(self, p):
+        for g in _trigrams(p.unique_id) | _trigrams(p.name):
+            self.grams[g].add(p.unique_id)
+        for g in _short_grams(p.unique_id) | _short_grams(p.name):
+            self.short[g].add(p.unique_id)
+        self.status[p.status].add(p.unique_id)
+        self.disease[p.disease.lower()].add(p.unique_id)
+        if p.doctor_id is not None:
+            self.doctor[p.doctor_id].add(p.unique_id)
+
+    def remove(self, p):
+        for g in _trigrams(p.unique_id) | _trigrams(p.name):
+            self._remove(self.grams, g, p.unique_id)
+        for g in _short_grams(p.unique_id) | _short_grams(p.name):
+            self._remove(self.short, g, p.unique_id)
+        self._remove(self.status, p.status, p.unique_id)
+        self._remove(self.disease, p.disease.lower(), p.unique_id)
+        self._remove(self.doctor, p.doctor_id, p.unique_id)
+
+    def move(self, table, old, new, pid):
+        """Re-file pid under a new value of one secondary field."""
+        self._remove(table, old, pid)
+        if new is not None:
+            table[new].add(pid)
+
+    def candidates(self, keyword):
+        """Patient IDs whose ID or name may contain keyword (a superset, never misses)."""
+        keyword = keyword.lower()
+        if not keyword:
+            # Every patient is filed under exactly one status.
+            return set().union(*self.status.values())
+        if len(keyword) < 3:
+            # Short keywords have their own postings: one lookup, exact result.
+            return self.short.get(keyword, set())
+
+        sets = []
+        for i in range(len(keyword) - 2):
+            ids = self.grams.get(keyword[i:i + 3])
+            if not ids:
+                return set()
+            sets.append(ids)
+        sets.sort(key=len)
+        return set(sets[0]).intersection(*sets[1:])
+
+
+# -------------------------
+# Doctor Caseload Index
+# -------------------------
+class CaseloadIndex:
+    """Per-doctor patient counts by status plus a least-loaded heap per specialization.
+
+    Heaps hold (admitted_count, doctor_id) entries. When a count changes a fresh
+    entry is pushed and the old one is left behind; stale entries are skipped
+    (and dropped) when they reach the top, so each update is O(log D).
+    """
+    def __init__(self):
+        self.counts = defaultdict(Counter)
+        self.specialization = {}
+        self.heaps = defaultdict(list)
+
+    @staticmethod
+    def _key(specialization):
+        return specialization.strip().lower()
+
+    def add_doctor(self, doctor):
+        did = doctor.unique_id
+        self.specialization[did] = self._key(doctor.specialization)
+        self.counts.setdefault(did, Counter())
+        self._push(did)
+
+    def _push(self, did):
+        spec = self.specialization.get(did)
+        if spec is None:
+            return
+        heap = self.heaps[spec]
+        heapq.heappush(heap, (self.counts[did]["Admitted"], did))
+        # Compact once stale entries dominate the heap.
+        if len(heap) > 4 * len(self.counts) + 16:
+            self.heaps[spec] = [(self.counts[d]["Admitted"], d)
+                                for d, sp in self.specialization.items() if sp == spec]
+            heapq.heapify(self.heaps[spec])
+
+    def update(self, did, old_status, new_status):
+        """Move one patient of did from old_status to new_status (None = none)."""
+        if did is None:
+            return
+        counts = self.counts[did]
+        if old_status is not None:
+            counts[old_status] -= 1
+            if counts[old_status] <= 0:
+                del counts[old_status]
+        if new_status is not None:
+            counts[new_status] += 1
+        if "Admitted" in (old_status, new_status):
+            self._push(did)
+
+    def least_loaded(self, specialization):
+        """Doctor ID with the fewest admitted patients in a specialization, or None."""
+        spec = self._key(specialization)
+        heap = self.heaps.get(spec)
+        while heap:
+            load, did = heap[0]
+            if self.specialization.get(did) == spec and self.counts[did]["Admitted"] == load:
+                return did
+            heapq.heappop(heap)
+        return None
+
+
+# -------------------------
+# Paginated Listing & Table Rendering
+# -------------------------
+PAGE_SIZE = 20
+
+Page = namedtuple("Page", ["rows", "page", "page_size", "total"])
+
+PATIENT_COLUMNS = [("ID", "patient_id", 8), ("Name", "name", 20), ("Age", "age", 5),
+                   ("Disease", "disease", 15), ("Status", "status", 12), ("Doctor", "doctor_id", 10)]
+DOCTOR_COLUMNS = [("ID", "doctor_id", 8), ("Name", "name", 20), ("Specialization", "specialization", 15),
+                  ("Admitted", "admitted", 9), ("Total", "total", 6)]
+
+
+def _sort_value(value):
+    """Sort key that orders numbers numerically, text case-insensitively and None last."""
+    if value is None:
+        return (1, 0, "")
+    try:
+        return (0, 0, float(value))
+    except (TypeError, ValueError):
+        return (0, 1, str(value).lower())
+
+
+def paginate(rows, page=1, page_size=PAGE_SIZE, sort_by=None, reverse=False, total=None):
+    """Return one Page of rows (dicts) without sorting or formatting the rest.
+
+    Unsorted pages are sliced straight from the iterator; sorted pages keep only
+    the top page * page_size rows in a heap. total is passed through when known.
+    """
+    if page < 1 or page_size < 1:
+        raise ValueError("page and page_size must be at least 1")
+    start = (page - 1) * page_size
+    if sort_by is None:
+        return Page(list(islice(rows, start, start + page_size)), page, page_size, total)
+
+    key = lambda r: _sort_value(r.get(sort_by))
+    pick = heapq.nlargest if reverse else heapq.nsmallest
+    top = pick(start + page_size, rows, key=key)
+    return Page(top[start:], page, page_size, total)
+
+
+def render_table(rows, columns, out=None):
+    """Write rows as a fixed-width table in one buffered write."""
+    out = out or sys.stdout
+    width = sum(w + 1 for _, _, w in columns)
+    lines = [" ".join(f"{title:<{w}}" for title, _, w in columns), "-" * width]
+    for r in rows:
+        lines.append(" ".join(f"{str(r.get(key)):<{w}}" for _, key, w in columns))
+    lines.append("-" * width)
+    out.write("\n".join(lines) + "\n")
+
+
+# -------------------------
+# Bulk Import
+# -------------------------
+BATCH_SIZE = 10000
+
+BatchReport = namedtuple("BatchReport", ["batch", "applied", "rejected", "seconds", "errors"])
+# Stands in for a line that could not be parsed, so it is rejected like any invalid record.
+BadLine = namedtuple("BadLine", ["error"])
+
+REQUIRED_FIELDS = {
+    "admit": ("patient_id", "name", "age", "disease"),
+    "discharge": ("patient_id",),
+    "assign": ("patient_id", "doctor_id"),
+    "doctor": ("doctor_id", "name", "specialization"),
+}
+
+# Fields stored as text; JSON Lines often carries IDs as numbers.
+TEXT_FIELDS = {"action", "patient_id", "doctor_id", "name", "disease", "specialization", "status"}
+
+
+def read_records(path):
+    """Stream records from a CSV (header row) or JSON Lines file as dicts."""
+    path = Path(path)
+    with open(path, newline="") as f:
+        if path.suffix.lower() == ".csv":
+            for row in csv.DictReader(f):
+                yield {k: (v if v != "" else None) for k, v in row.items()}
+        else:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as e:
+                        yield BadLine(f"invalid JSON ({e.msg})")
+
+
+def _batches(records, size):
+    it = iter(records)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+# -------------------------
+# File Locking (POSIX fcntl / Windows msvcrt)
+# -------------------------
+try:
+    import fcntl
+
+    def _lock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+except ImportError:
+    import msvcrt
+
+    def _lock_file(f):
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+    def _unlock_file(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+# -------------------------
+# Shared-Mode Journal
+#
+# In shared mode each commit appends one line to <data_file>.journal instead
+# of rewriting the whole records file: "<version>\t{"patients": {...},
+# "doctors": {...}}" holding the new state of every record it changed (null
+# = removed). The first line, "#<version>", is the version of the snapshot
+# the journal continues from. Once the journal grows past CHECKPOINT_BYTES
+# it is folded into a fresh snapshot and started again.
+# -------------------------
+CHECKPOINT_BYTES = 1 << 20
+
+
 # -------------------------
 # Hospital Management System
 # -------------------------
 class HospitalManagement:
-    def __init__(self):
+    def __init__(self, data_file="hospital_records.json", shared=False):
         self.patients = {}
         self.doctors = {}
-        self.data_file = Path("hospital_records.json")
+        self.index = PatientIndex()
+        self.caseload = CaseloadIndex()
+        self.data_file = Path(data_file)
+        # Shared (multi-desk) mode: every change is committed to data_file under a lock.
+        self.shared = shared
+        # Version of the data we last read or wrote; None until the file has been read.
+        self.version = None
+        self.conflicts = 0
+        self.commits = 0
+        # Records changed since the last commit, and how far into the journal we have read.
+        self.dirty_patients = set()
+        self.dirty_doctors = set()
+        self.journal_base = None
+        self.journal_pos = None
+
+    # Index maintenance
+    def register_patient(self, patient):
+        old = self.patients.get(patient.unique_id)
+        if old is not None:
+            self.index.remove(old)
+            self.caseload.update(old.doctor_id, old.status, None)
+        self.patients[patient.unique_id] = patient
+        self.index.add(patient)
+        self.caseload.update(patient.doctor_id, None, patient.status)
+        self.dirty_patients.add(patient.unique_id)
+
+    def register_doctor(self, doctor):
+        self.doctors[doctor.unique_id] = doctor
+        self.caseload.add_doctor(doctor)
+        self.dirty_doctors.add(doctor.unique_id)
+
+    def drop_patient(self, pid):
+        p = self.patients.pop(pid, None)
+        if p is not None:
+            self.index.remove(p)
+            self.caseload.update(p.doctor_id, p.status, None)
+            self.dirty_patients.add(pid)
+
+    def drop_doctor(self, did):
+        if self.doctors.pop(did, None) is not None:
+            self.caseload.specialization.pop(did, None)
+            self.dirty_doctors.add(did)
+
+    def mark_discharged(self, pid):
+        self.dirty_patients.add(pid)
+        p = self.patients[pid]
+        self.index.move(self.index.status, p.status, "Discharged", pid)
+        self.caseload.update(p.doctor_id, p.status, "Discharged")
+        p.discharge()
+
+    def link_doctor(self, pid, did):
+        self.dirty_patients.add(pid)
+        p = self.patients[pid]
+        self.index.move(self.index.doctor, p.doctor_id, did, pid)
+        self.caseload.update(p.doctor_id, p.status, None)
+        self.caseload.update(did, None, p.status)
+        p.assign_doctor(did)
+
+    def rebuild_index(self):
+        self.index = PatientIndex()
+        self.caseload = CaseloadIndex()
+        for d in self.doctors.values():
+            self.caseload.add_doctor(d)
+        for p in self.patients.values():
+            self.index.add(p)
+            self.caseload.update(p.doctor_id, None, p.status)
+
+    # Doctor caseload
+    def doctor_patients(self, did):
+        return [self.patients[pid] for pid in self.index.doctor.get(did, ())]
+
+    def doctor_caseload(self, did):
+        """Patient counts for a doctor keyed by status, e.g. {"Admitted": 3}."""
+        return dict(self.caseload.counts.get(did, {}))
+
+    def auto_assign(self, pid, specialization):
+        """Assign the least-loaded doctor of a specialization; returns the doctor ID or None."""
+        did = self.caseload.least_loaded(specialization)
+        if did is not None:
+            self.link_doctor(pid, did)
+        return did
+
+    # Listing
+    def _patient_source(self, status=None, disease=None, doctor_id=None):
+        if status is None and disease is None and doctor_id is None:
+            return self.patients.values()
+        return self.filter_patients(status, disease, doctor_id)
+
+    def iter_doctor_rows(self, specialization=None):
+        """Yield doctor rows (dicts) with admitted / total caseload columns."""
+        spec = specialization.strip().lower() if specialization else None
+        for d in self.doctors.values():
+            if spec is not None and d.specialization.strip().lower() != spec:
+                continue
+            counts = self.doctor_caseload(d.unique_id)
+            row = d.to_dict()
+            row["admitted"] = counts.get("Admitted", 0)
+            row["total"] = sum(counts.values())
+            yield row
+
+    def list_patients(self, page=1, page_size=PAGE_SIZE, sort_by=None, reverse=False,
+                      status=None, disease=None, doctor_id=None):
+        source = self._patient_source(status, disease, doctor_id)
+        rows = (p.to_dict() for p in source)
+        return paginate(rows, page, page_size, sort_by, reverse, total=len(source))
+
+    def list_doctors(self, page=1, page_size=PAGE_SIZE, sort_by=None, reverse=False,
+                     specialization=None):
+        rows = self.iter_doctor_rows(specialization)
+        total = len(self.doctors) if specialization is None else None
+        return paginate(rows, page, page_size, sort_by, reverse, total=total)
+
+    def _show_pages(self, lister, columns):
+        """Print a listing one page at a time until the user stops or it runs out."""
+        page = 1
+        while True:
+            result = lister(page=page, page_size=PAGE_SIZE)
+            render_table(result.rows, columns)
+            if len(result.rows) < PAGE_SIZE or (result.total is not None and page * PAGE_SIZE >= result.total):
+                return
+            if input(f"Page {page} - Enter for next page, q to stop: ").strip().lower() == "q":
+                return
+            page += 1
+
+    # Indexed queries
+    def get_patient(self, pid):
+        return self.patients.get(pid)
+
+    def find_patients(self, keyword):
+        """Patients whose ID or name contains keyword (case-insensitive)."""
+        keyword = keyword.lower()
+        results = []
+        for pid in self.index.candidates(keyword):
+            p = self.patients[pid]
+            if keyword in pid.lower() or keyword in p.name.lower():
+                results.append(p)
+        return results
+
+    def find_by_prefix(self, prefix):
+        """Patients whose ID or any word of their name starts with prefix."""
+        prefix = prefix.lower()
+        results = []
+        for pid in self.index.candidates(prefix):
+            p = self.patients[pid]
+            tokens = [pid.lower()] + p.name.lower().split()
+            if any(t.startswith(prefix) for t in tokens):
+                results.append(p)
+        return results
+
+    def filter_patients(self, status=None, disease=None, doctor_id=None):
+        """Patients matching every given field, using the secondary indexes."""
+        sets = []
+        if status is not None:
+            sets.append(self.index.status.get(status, set()))
+        if disease is not None:
+            sets.append(self.index.disease.get(disease.lower(), set()))
+        if doctor_id is not None:
+            sets.append(self.index.doctor.get(doctor_id, set()))
+        if not sets:
+            return list(self.patients.values())
+
+        sets.sort(key=len)
+        ids = set(sets[0]).intersection(*sets[1:])
+        return [self.patients[pid] for pid in ids]
 
     # Add patient
     def add_patient(self):
@@ -80,26 +537,27 @@ class HospitalManagement:
         name = input("Enter name: ")
         age = input("Enter age: ")
         disease = input("Enter disease: ")
-        self.patients[pid] = Patient(name, pid, age, disease)
-        print("Patient added successfully.")
+
+        def op():
+            self.register_patient(Patient(name, pid, age, disease))
+            return "Patient added successfully."
+        print(self.commit(op))
 
     # View patient list
     def view_patients(self):
         print("\n--- Patient List ---")
+        self.refresh()
         if not self.patients:
             print("No patient data available.")
             return
 
-        print(f"{'ID':<8} {'Name':<20} {'Age':<5} {'Disease':<15} {'Status':<12} {'Doctor':<10}")
-        print("-" * 70)
-        for p in self.patients.values():
-            print(f"{p.unique_id:<8} {p.name:<20} {p.age:<5} {p.disease:<15} {p.status:<12} {p.doctor_id}")
-        print("-" * 70)
+        self._show_pages(self.list_patients, PATIENT_COLUMNS)
 
     # Search patient
     def search_patient(self):
-        keyword = input("Enter Patient ID or Name keyword: ").lower()
-        results = [p for p in self.patients.values() if keyword in p.unique_id.lower() or keyword in p.name.lower()]
+        keyword = input("Enter Patient ID or Name keyword: ")
+        self.refresh()
+        results = self.find_patients(keyword)
 
         if results:
             for p in results:
@@ -110,11 +568,13 @@ class HospitalManagement:
     # Discharge
     def discharge_patient(self):
         pid = input("Enter Patient ID to discharge: ")
-        if pid in self.patients:
-            self.patients[pid].discharge()
-            print("Patient discharged successfully.")
-        else:
-            print("Patient ID not found.")
+
+        def op():
+            if pid not in self.patients:
+                return "Patient ID not found."
+            self.mark_discharged(pid)
+            return "Patient discharged successfully."
+        print(self.commit(op))
 
     # Add doctor
     def add_doctor(self):
@@ -122,47 +582,372 @@ class HospitalManagement:
         did = input("Enter Doctor ID: ")
         name = input("Enter Doctor Name: ")
         spec = input("Enter Specialization: ")
-        self.doctors[did] = Doctor(name, did, spec)
-        print("Doctor added successfully.")
+
+        def op():
+            self.register_doctor(Doctor(name, did, spec))
+            return "Doctor added successfully."
+        print(self.commit(op))
 
     # View doctors
     def view_doctors(self):
         print("\n--- Doctor List ---")
+        self.refresh()
         if not self.doctors:
             print("No doctor data available.")
             return
 
-        print(f"{'ID':<8} {'Name':<20} {'Specialization':<15}")
-        print("-" * 50)
-        for d in self.doctors.values():
-            print(f"{d.unique_id:<8} {d.name:<20} {d.specialization:<15}")
-        print("-" * 50)
+        self._show_pages(self.list_doctors, DOCTOR_COLUMNS)
 
     # Assign doctor
     def assign_doctor(self):
         pid = input("Enter Patient ID: ")
         did = input("Enter Doctor ID: ")
 
-        if pid not in self.patients:
-            print("Patient not found.")
-            return
-        if did not in self.doctors:
-            print("Doctor not found.")
+        def op():
+            if pid not in self.patients:
+                return "Patient not found."
+            if did not in self.doctors:
+                return "Doctor not found."
+            self.link_doctor(pid, did)
+            return "Doctor assigned successfully."
+        print(self.commit(op))
+
+    # Auto-assign doctor
+    def auto_assign_doctor(self):
+        pid = input("Enter Patient ID: ")
+        spec = input("Enter Specialization: ")
+
+        def op():
+            if pid not in self.patients:
+                return "Patient not found."
+            did = self.auto_assign(pid, spec)
+            if did is None:
+                return "No doctor with that specialization."
+            return f"Assigned {self.doctors[did]} (least loaded)."
+        print(self.commit(op))
+
+    # Bulk import
+    def _validate_record(self, rec, new_patients, new_doctors):
+        """Return (error, normalized record); text fields are coerced to str."""
+        if isinstance(rec, BadLine):
+            return rec.error, None
+        if not isinstance(rec, dict):
+            return f"not a record: {rec!r}", None
+        rec = {k: (str(v) if k in TEXT_FIELDS and v is not None else v) for k, v in rec.items()}
+        action = (rec.get("action") or "").strip().lower()
+        if action not in REQUIRED_FIELDS:
+            return f"unknown action {rec.get('action')!r}", None
+        missing = [f for f in REQUIRED_FIELDS[action] if rec.get(f) in (None, "")]
+        if missing:
+            return f"{action}: missing {', '.join(missing)}", None
+        rec["action"] = action
+
+        pid, did = rec.get("patient_id"), rec.get("doctor_id")
+        if action in ("discharge", "assign") and pid not in self.patients and pid not in new_patients:
+            return f"{action}: patient {pid} not found", None
+        if action in ("admit", "assign") and did and did not in self.doctors and did not in new_doctors:
+            return f"{action}: doctor {did} not found", None
+
+        if action == "admit":
+            new_patients.add(pid)
+        elif action == "doctor":
+            new_doctors.add(did)
+        return None, rec
+
+    def _apply_record(self, rec, undo):
+        """Apply one validated record, saving the first prior state of what it touches in undo."""
+        action = rec["action"]
+        if action == "doctor":
+            did = rec["doctor_id"]
+            if ("doctor", did) not in undo:
+                old = self.doctors.get(did)
+                undo[("doctor", did)] = old and Doctor(**old.to_dict())
+            self.register_doctor(Doctor(rec["name"], did, rec["specialization"]))
             return
 
-        self.patients[pid].assign_doctor(did)
-        print("Doctor assigned successfully.")
+        pid = rec["patient_id"]
+        if ("patient", pid) not in undo:
+            old = self.patients.get(pid)
+            undo[("patient", pid)] = old and Patient(**old.to_dict())
+        if action == "admit":
+            self.register_patient(Patient(rec["name"], pid, rec["age"], rec["disease"],
+                                          rec.get("status") or "Admitted", rec.get("doctor_id")))
+        elif action == "discharge":
+            self.mark_discharged(pid)
+        elif action == "assign":
+            self.link_doctor(pid, rec["doctor_id"])
 
-    # Save data
-    def save_data(self):
+    def _rollback(self, undo):
+        """Restore the patients / doctors saved by _apply_record and rebuild the indexes."""
+        for (kind, key), old in undo.items():
+            table = self.patients if kind == "patient" else self.doctors
+            if old is None:
+                table.pop(key, None)
+            else:
+                table[key] = old
+            (self.dirty_patients if kind == "patient" else self.dirty_doctors).add(key)
+        self.rebuild_index()
+
+    def import_records(self, records, batch_size=BATCH_SIZE, strict=False):
+        """Apply admit / discharge / assign / doctor records in batches.
+
+        Each batch is validated in full before any of it is applied. Invalid
+        records are skipped, or with strict=True the whole batch is rejected.
+        A batch that fails while being applied is rolled back as a whole.
+        Yields a BatchReport per batch.
+        """
+        for n, batch in enumerate(_batches(records, batch_size), start=1):
+            start = time.perf_counter()
+            new_patients, new_doctors = set(), set()
+            valid, errors = [], []
+            for i, rec in enumerate(batch):
+                err, rec = self._validate_record(rec, new_patients, new_doctors)
+                if err:
+                    errors.append(f"record {(n - 1) * batch_size + i + 1}: {err}")
+                else:
+                    valid.append(rec)
+
+            if strict and errors:
+                valid = []
+            undo = {}
+            try:
+                for rec in valid:
+                    self._apply_record(rec, undo)
+            except Exception as e:
+                self._rollback(undo)
+                errors.append(f"batch {n} rolled back: {e!r}")
+                valid = []
+
+            yield BatchReport(n, len(valid), len(batch) - len(valid), time.perf_counter() - start, errors)
+
+    def import_file(self, path, batch_size=BATCH_SIZE, strict=False):
+        """Import a CSV / JSON Lines file, printing per-batch throughput."""
+        applied = rejected = 0
+        total_start = time.perf_counter()
+        for report in self.import_records(read_records(path), batch_size, strict):
+            applied += report.applied
+            rejected += report.rejected
+            rate = (report.applied + report.rejected) / report.seconds if report.seconds else 0
+            print(f"Batch {report.batch}: {report.applied} applied, {report.rejected} rejected "
+                  f"in {report.seconds:.3f}s ({rate:,.0f} records/s)")
+            for err in report.errors[:5]:
+                print("  ", err)
+            if len(report.errors) > 5:
+                print(f"   ... {len(report.errors) - 5} more")
+        elapsed = time.perf_counter() - total_start
+        print(f"Imported {applied} records ({rejected} rejected) from {path} in {elapsed:.2f}s")
+        return applied, rejected
+
+    def bulk_import(self):
+        path = input("Enter CSV / JSONL file path: ").strip()
+        try:
+            # In shared mode the whole import is applied and written under the lock.
+            self.commit(lambda: self.import_file(path))
+        except Exception as e:
+            print("Error importing file:", e)
+
+    # Shared-file concurrency
+    @property
+    def lock_file(self):
+        return self.data_file.with_name(self.data_file.name + ".lock")
+
+    @contextmanager
+    def _locked(self):
+        """Hold an exclusive lock on the sidecar lock file, which also stores the data version."""
+        with open(self.lock_file, "a+") as f:
+            _lock_file(f)
+            try:
+                yield f
+            finally:
+                _unlock_file(f)
+
+    @property
+    def journal_file(self):
+        return self.data_file.with_name(self.data_file.name + ".journal")
+
+    @staticmethod
+    def _read_version(lock):
+        lock.seek(0)
+        text = lock.read().strip()
+        return int(text) if text else 0
+
+    def _write_version(self, lock):
+        lock.seek(0)
+        lock.truncate()
+        lock.write(str(self.version))
+        lock.flush()
+
+    def _checkpoint(self):
+        """Write the full records as a snapshot at the current version and start an empty journal."""
         data = {
+            "version": self.version,
             "patients": {pid: p.to_dict() for pid, p in self.patients.items()},
             "doctors": {did: d.to_dict() for did, d in self.doctors.items()}
         }
+        tmp = self.data_file.with_name(self.data_file.name + ".tmp")
+        with open(tmp, "w") as f:
+            # Desk snapshots are rewritten often; skip the indentation there.
+            json.dump(data, f, indent=None if self.shared else 4)
+        os.replace(tmp, self.data_file)
+        header = f"#{self.version}\n".encode()
+        with open(self.journal_file, "wb") as f:
+            f.write(header)
+        self.journal_base, self.journal_pos = self.version, len(header)
+        self.dirty_patients.clear()
+        self.dirty_doctors.clear()
+
+    def _write_data(self, lock):
+        """Save everything as a new version (caller holds the lock)."""
+        # Never below the on-disk version, so a desk holding an older number always sees a change.
+        self.version = max(self.version or 0, self._read_version(lock)) + 1
+        self._checkpoint()
+        self._write_version(lock)
+
+    def _append_journal(self, lock):
+        """Append the records changed since the last commit as the next version."""
+        if not self.dirty_patients and not self.dirty_doctors:
+            return
+        self.version = max(self.version or 0, self._read_version(lock)) + 1
+        entry = {
+            "patients": {pid: p.to_dict() if (p := self.patients.get(pid)) else None
+                         for pid in self.dirty_patients},
+            "doctors": {did: d.to_dict() if (d := self.doctors.get(did)) else None
+                        for did in self.dirty_doctors},
+        }
+        self.dirty_patients.clear()
+        self.dirty_doctors.clear()
+        with open(self.journal_file, "ab") as f:
+            if f.tell() == 0:
+                header = f"#{self.version - 1}\n".encode()
+                f.write(header)
+                self.journal_base = self.version - 1
+            f.write(f"{self.version}\t{json.dumps(entry)}\n".encode())
+            self.journal_pos = f.tell()
+        self._write_version(lock)
+        if not self.data_file.exists() or self.journal_pos > CHECKPOINT_BYTES:
+            self._checkpoint()
+
+    def _replay(self):
+        """Apply journal entries newer than our version; False if some are no longer in the journal."""
+        if not self.journal_file.exists():
+            return True
+        with open(self.journal_file, "rb") as f:
+            header = f.readline()
+            base = int(header[1:]) if header.startswith(b"#") else 0
+            if base == self.journal_base and self.journal_pos is not None:
+                f.seek(self.journal_pos)
+            elif self.version < base:
+                return False   # folded into a snapshot newer than our copy
+            pos = f.tell()
+            for line in iter(f.readline, b""):
+                if not line.endswith(b"\n"):
+                    break      # half-written line from an interrupted commit
+                version, _, body = line.partition(b"\t")
+                version = int(version)
+                if version > self.version:
+                    if version != self.version + 1:
+                        return False
+                    self._apply_entry(json.loads(body))
+                    self.version = version
+                pos = f.tell()
+        self.journal_base, self.journal_pos = base, pos
+        self.dirty_patients.clear()
+        self.dirty_doctors.clear()
+        return True
+
+    def _apply_entry(self, entry):
+        for did, info in entry["doctors"].items():
+            if info is None:
+                self.drop_doctor(did)
+            else:
+                self.register_doctor(Doctor(**info))
+        for pid, info in entry["patients"].items():
+            if info is None:
+                self.drop_patient(pid)
+            else:
+                self.register_patient(Patient(**info))
+
+    def _read_data(self):
+        """Load the snapshot, then every journal entry written since it."""
+        with open(self.data_file, "r") as f:
+            data = json.load(f)
 
+        self.patients = {pid: Patient(**info) for pid, info in data["patients"].items()}
+        self.doctors = {did: Doctor(**info) for did, info in data["doctors"].items()}
+        self.version = data.get("version", 0)
+        self.rebuild_index()
+        self.journal_base = self.journal_pos = None
+        self._replay()
+
+    def refresh(self):
+        """In shared mode, catch up if another desk has committed since our last read."""
+        if not self.shared:
+            return
+        with self._locked() as lock:
+            self._sync(lock)
+
+    def _sync(self, lock):
+        """Bring our copy up to the on-disk version; True if it was stale.
+
+        Usually only the journal entries since our version are applied, which
+        updates the indexes record by record. The snapshot is reloaded (and the
+        indexes rebuilt) only on first use, or when the entries we lack have
+        already been folded into a newer snapshot.
+        """
+        disk = self._read_version(lock)
+        if self.version is not None and disk == self.version:
+            return False
+        if self.version is not None and self._replay() and self.version == disk:
+            return True
+        if self.data_file.exists():
+            self._read_data()
+            if disk != self.version:
+                # The lock file has no version yet (e.g. the first desk on an existing
+                # records file); the data file is authoritative, so record its version.
+                self._write_version(lock)
+        else:
+            self.version = disk
+        return True
+
+    def commit(self, op):
+        """Run op (validate + mutate, returns a message) as one transaction.
+
+        Optimistic versioning: work happens on the in-memory copy, and at commit
+        time the on-disk version is checked under the lock. If another desk
+        committed in between, this copy is stale - count a conflict, catch up,
+        and re-run op against the fresh data. Only the records op changed are
+        written, as one journal entry.
+        """
+        if not self.shared:
+            return op()
+
+        with self._locked() as lock:
+            loaded = self.version is not None
+            if self._sync(lock) and loaded:
+                self.conflicts += 1
+            self.dirty_patients.clear()
+            self.dirty_doctors.clear()
+            try:
+                result = op()
+            except Exception:
+                # op may have half-changed our copy; discard it on the next sync.
+                self.version = None
+                raise
+            self._append_journal(lock)
+            self.commits += 1
+        return result
+
+    # Save data
+    def save_data(self):
         try:
-            with open(self.data_file, "w") as f:
-                json.dump(data, f, indent=4)
+            with self._locked() as lock:
+                if self.shared:
+                    # Catch up first so a stale copy never replaces other desks' changes;
+                    # then fold the journal into the records file.
+                    self._sync(lock)
+                    self._checkpoint()
+                else:
+                    self._write_data(lock)
             print("Data saved successfully.")
         except Exception as e:
             print("Error saving file:", e)
@@ -174,11 +959,8 @@ class HospitalManagement:
             return
 
         try:
-            with open(self.data_file, "r") as f:
-                data = json.load(f)
-
-            self.patients = {pid: Patient(**info) for pid, info in data["patients"].items()}
-            self.doctors = {did: Doctor(**info) for did, info in data["doctors"].items()}
+            with self._locked():
+                self._read_data()
 
             print("Data loaded successfully.")
         except Exception as e:
@@ -188,8 +970,10 @@ class HospitalManagement:
 # -------------------------
 # CLI Menu
 # -------------------------
-def menu():
-    HMS = HospitalManagement()
+def menu(shared=False):
+    HMS = HospitalManagement(shared=shared)
+    if shared:
+        HMS.refresh()
 
     while True:
         print("\n======= Hospital Management System =======")
@@ -202,6 +986,8 @@ def menu():
         print("7. Assign Doctor to Patient")
         print("8. Save Records")
         print("9. Load Records")
+        print("10. Auto-assign Doctor")
+        print("11. Bulk Import (CSV / JSONL)")
         print("0. Exit")
 
         ch = input("Enter choice: ")
@@ -215,6 +1001,8 @@ def menu():
         elif ch == "7": HMS.assign_doctor()
         elif ch == "8": HMS.save_data()
         elif ch == "9": HMS.load_data()
+        elif ch == "10": HMS.auto_assign_doctor()
+        elif ch == "11": HMS.bulk_import()
         elif ch == "0":
             print("Goodbye!")
             break
@@ -222,5 +1010,24 @@ def menu():
             print("Invalid choice. Try again.")
 
 
+# -------------------------
+# Non-interactive import
+#   python hospital_manager.py import admissions.csv [more.jsonl ...]
+# -------------------------
+def run_import(paths):
+    HMS = HospitalManagement()
+    if HMS.data_file.exists():
+        HMS.load_data()
+    for path in paths:
+        HMS.import_file(path)
+    HMS.save_data()
+
+
 if __name__ == "__main__":
-    menu()
+    if len(sys.argv) > 2 and sys.argv[1] == "import":
+        run_import(sys.argv[2:])
+    elif len(sys.argv) > 1 and sys.argv[1] == "desk":
+        # Multi-desk mode: each change is saved immediately and merged with other desks.
+        menu(shared=True)
+    else:
+        menu()
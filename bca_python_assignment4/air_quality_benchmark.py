@@ -0,0 +1,192 @@
+# ------------------------------
+# Air Quality Pipeline Benchmarks
+#
+# Generates synthetic hourly readings for many stations and times the
+# pipeline stages in air_quality_visualize.py.
+#
+# Usage:
+#   python air_quality_benchmark.py batch --stations 64 --years 2
+#   python air_quality_benchmark.py batch --stations 64 --years 2 --multi
+#   python air_quality_benchmark.py plots --years 1 2 5
+#   python air_quality_benchmark.py columnar --years 5
+#   python air_quality_benchmark.py index --years 1 10 30
+# ------------------------------
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import air_quality_visualize as aq
+from aqi_index import AQITimeIndex
+
+
+# ------------------------------
+# Synthetic Data
+# ------------------------------
+def make_station_frame(seed, years=1):
+    """Hourly readings with a winter peak and noise, shaped like aqi_data.csv."""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2022-01-01", periods=int(365 * 24 * years), freq="h")
+    season = 1 + 0.5 * np.cos(2 * np.pi * dates.dayofyear.to_numpy() / 365)
+    n = len(dates)
+    df = pd.DataFrame({
+        "Date": dates.strftime("%Y-%m-%d %H:%M:%S"),
+        "PM2.5": (80 * season + rng.normal(0, 25, n)).clip(5).round(1),
+        "PM10": (130 * season + rng.normal(0, 40, n)).clip(10).round(1),
+        "AQI": (180 * season + rng.normal(0, 50, n)).clip(20).round(0),
+        "NO2": rng.uniform(10, 70, n).round(1),
+        "SO2": rng.uniform(5, 50, n).round(1),
+    })
+    # A few gaps, as real sensor exports have.
+    df.loc[rng.choice(n, n // 200, replace=False), "PM10"] = np.nan
+    return df
+
+
+def write_stations(folder, stations, years):
+    folder = Path(folder)
+    paths = []
+    for i in range(stations):
+        path = folder / f"station_{i:03d}.csv"
+        make_station_frame(i, years).to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def write_multi_station(folder, stations, years):
+    """All stations in one CSV with a Station column, like a network-wide export."""
+    path = Path(folder) / "all_stations.csv"
+    for i in range(stations):
+        df = make_station_frame(i, years)
+        df.insert(0, "Station", f"station_{i:03d}")
+        df.to_csv(path, mode="a", header=i == 0, index=False)
+    return [path]
+
+
+# ------------------------------
+# Benchmarks
+# ------------------------------
+def bench_batch(args):
+    """Throughput of run_batch at 1, 2, 4, ... workers up to the CPU count.
+
+    --multi writes every station into a single CSV instead of one file each.
+    """
+    cores = os.cpu_count() or 1
+    counts = sorted({1, *[2 ** k for k in range(1, 8) if 2 ** k <= cores], cores})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        layout = "one file" if args.multi else "one file per station"
+        print(f"Writing {args.stations} stations x {args.years} year(s) of hourly data ({layout})...")
+        write = write_multi_station if args.multi else write_stations
+        paths = write(tmp, args.stations, args.years)
+
+        print(f"{'Workers':>8} {'Seconds':>9} {'Readings/s':>14} {'Speed-up':>9}")
+        base = None
+        for workers in counts:
+            result = aq.run_batch(paths, Path(tmp) / "out", workers=workers, quiet=True)
+            base = base or result["seconds"]
+            print(f"{workers:>8} {result['seconds']:>9.2f} "
+                  f"{result['readings'] / result['seconds']:>14,.0f} {base / result['seconds']:>8.2f}x")
+
+
+def bench_plots(args):
+    """Chart render time with and without downsampling as the series grows."""
+    print(f"{'Years':>6} {'Readings':>10} {'Full (s)':>9} {'Budget (s)':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for years in args.years:
+            df = aq.clean_data(make_station_frame(0, years))
+            monthly = aq.compute_stats(df)["monthly_avg"]
+            timings = []
+            for max_points, hexbin in ((None, float("inf")), (args.max_points, aq.HEXBIN_THRESHOLD)):
+                start = time.perf_counter()
+                aq.plot_charts(df, monthly, tmp, max_points=max_points, hexbin_threshold=hexbin)
+                timings.append(time.perf_counter() - start)
+            print(f"{years:>6} {len(df):>10,} {timings[0]:>9.2f} {timings[1]:>11.2f}")
+
+
+def _size(path):
+    path = Path(path)
+    return path.stat().st_size if path.is_file() else sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def bench_columnar(args):
+    """Export size / time and a one-month, one-column read: CSV vs Parquet vs Feather."""
+    df = aq.clean_data(make_station_frame(0, args.years))
+    month = df.index[len(df) // 2].strftime("%Y-%m")
+    print(f"{len(df):,} readings; query = AQI for {month}")
+    print(f"{'Format':<8} {'Export (s)':>10} {'Size (MB)':>10} {'Query (s)':>10}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        start = time.perf_counter()
+        aq.export_cleaned(df, tmp / "cleaned.csv")
+        export = time.perf_counter() - start
+        start = time.perf_counter()
+        full = pd.read_csv(tmp / "cleaned.csv", parse_dates=["Date"], index_col="Date")
+        full.loc[month, "AQI"]
+        query = time.perf_counter() - start
+        print(f"{'csv':<8} {export:>10.3f} {_size(tmp / 'cleaned.csv') / 1e6:>10.2f} {query:>10.3f}")
+
+        for fmt in sorted(aq.COLUMNAR_FORMATS):
+            root = tmp / aq.COLUMNAR_DIR.format(fmt=fmt)
+            start = time.perf_counter()
+            aq.export_columnar(df, root, "bench", fmt)
+            export = time.perf_counter() - start
+            start = time.perf_counter()
+            aq.load_columnar(root, columns=["AQI"], start=f"{month}-01", end=pd.Period(month).end_time)
+            query = time.perf_counter() - start
+            print(f"{fmt:<8} {export:>10.3f} {_size(root) / 1e6:>10.2f} {query:>10.3f}")
+
+
+def bench_index(args):
+    """Date-range mean: AQITimeIndex prefix sums vs filtering the DataFrame."""
+    print(f"{'Years':>6} {'Readings':>10} {'Build (ms)':>11} {'Index (us)':>11} {'DataFrame (us)':>15}")
+    for years in args.years:
+        df = aq.clean_data(make_station_frame(0, years))
+        start = time.perf_counter()
+        index = AQITimeIndex.from_frame(df)
+        build = time.perf_counter() - start
+
+        lo, hi = df.index[len(df) // 3], df.index[len(df) // 2]
+        timings = []
+        for query in (lambda: index.range_mean(lo, hi), lambda: df.loc[lo:hi, aq.POLLUTANTS].mean()):
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                query()
+            timings.append((time.perf_counter() - start) / args.repeat * 1e6)
+        print(f"{years:>6} {len(df):>10,} {build * 1000:>11.1f} {timings[0]:>11.1f} {timings[1]:>15.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the air-quality pipeline.")
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    p = sub.add_parser("batch", help="multi-station process-pool aggregation")
+    p.add_argument("--stations", type=int, default=32)
+    p.add_argument("--years", type=float, default=1)
+    p.add_argument("--multi", action="store_true", help="all stations in one CSV with a Station column")
+    p.set_defaults(func=bench_batch)
+
+    p = sub.add_parser("plots", help="chart rendering: every point vs downsampled / hexbin")
+    p.add_argument("--years", type=float, nargs="+", default=[1, 2, 5])
+    p.add_argument("--max-points", type=int, default=aq.MAX_PLOT_POINTS)
+    p.set_defaults(func=bench_plots)
+
+    p = sub.add_parser("columnar", help="CSV vs partitioned Parquet / Feather export and read")
+    p.add_argument("--years", type=float, default=5)
+    p.set_defaults(func=bench_columnar)
+
+    p = sub.add_parser("index", help="date-range means from the precomputed time index")
+    p.add_argument("--years", type=float, nargs="+", default=[1, 10, 30])
+    p.add_argument("--repeat", type=int, default=1000)
+    p.set_defaults(func=bench_index)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,87 +1,767 @@
+# ------------------------------
+# Air Quality Data Visualizer
+#
+# Usage:
+#   python air_quality_visualize.py                      (uses aqi_data.csv)
+#   python air_quality_visualize.py station1.csv station2.csv --out-dir results
+#   python air_quality_visualize.py aqi_data.csv --verbose --no-plots
+#   python air_quality_visualize.py data/*.csv --batch --workers 8 -o results
+#   python air_quality_visualize.py big_export.csv --chunksize 500000 -o results
+#   python air_quality_visualize.py feed.csv --live -o results
+#   python air_quality_visualize.py aqi_data.csv --columnar parquet -o results
+#
+# Each step (load -> clean -> aggregate -> plot -> export) is a function, so a
+# long-running process can import this module once and call run_pipeline()
+# for as many station files as it needs.
+# ------------------------------
+
 # ------------------------------
 # Import Necessary Libraries
 # ------------------------------
+import argparse
+import csv
+import io
+import os
+import shutil
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import nullcontext
+from pathlib import Path
+from urllib.parse import quote
+
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use("Agg")  # file output only; safe in worker processes
+from matplotlib.figure import Figure
+
+from aqi_live import LiveAQIStats
+
+BASE_DIR = Path(__file__).resolve().parent
+DEFAULT_INPUT = BASE_DIR / "aqi_data.csv"
+
+POLLUTANTS = ["PM2.5", "PM10", "AQI", "NO2", "SO2"]
+COLUMNS = ["Date"] + POLLUTANTS
+
+CHART_FILES = {
+    "daily_aqi": "daily_aqi.png",
+    "monthly_pm25": "monthly_pm25.png",
+    "pm_scatter": "pm_scatter.png",
+    "subplot_pm": "subplot_pm.png",
+}
+# Explicit read schema: only the needed columns, float32 pollutants, parsed dates.
+DTYPES = {col: "float32" for col in POLLUTANTS}
+DTYPES["Station"] = "category"
+
+CHART_TIMINGS_FILE = "chart_timings.csv"
+ChartResult = namedtuple("ChartResult", ["path", "seconds"])
+
+CLEANED_FILE = "cleaned_air_quality.csv"
+DAILY_FILE = "daily_aggregates.csv"
+MONTHLY_FILE = "monthly_aggregates.csv"
+ANOMALY_FILE = "anomalies.csv"
+
+# Columnar exports: <out_dir>/cleaned_air_quality.<fmt>/Station=<s>/Month=<YYYY-MM>/part-<n>.<fmt>
+COLUMNAR_FORMATS = {"parquet": "zstd", "feather": "lz4"}   # format -> compression
+COLUMNAR_DIR = "cleaned_air_quality.{fmt}"
+
+# Plot budgets: line charts keep at most MAX_PLOT_POINTS points (LTTB), and the
+# PM2.5 vs PM10 scatter turns into a hexbin above HEXBIN_THRESHOLD readings.
+MAX_PLOT_POINTS = 2000
+HEXBIN_THRESHOLD = 5000
+STATION_MONTH_FILE = "station_month.csv"
+STATION_CALENDAR_FILE = "station_calendar_month.csv"
+# Batch mode parses multi-station files in byte ranges of about this size, one per task.
+SHARD_BYTES = 16 << 20
+FileRange = namedtuple("FileRange", ["path", "start", "end", "n"])
+
 
 # ------------------------------
 # Task 1: Data Loading
 # ------------------------------
-df = pd.read_csv("air_quality_raw.csv")
-print(df.head())
-print(df.info())
-print(df.describe())
+def load_data(path, verbose=False):
+    """Read a raw air-quality CSV. verbose prints head / info / describe."""
+    df = pd.read_csv(path)
+    if verbose:
+        print(df.head())
+        print(df.info())
+        print(df.describe())
+    return df
+
+
+def read_typed(path, chunksize=None, station=False):
+    """read_csv with the explicit schema; returns an iterator of chunks if chunksize is set."""
+    wanted = set(COLUMNS) | ({"Station"} if station else set())
+    return pd.read_csv(path, usecols=lambda c: c in wanted, dtype=DTYPES,
+                       parse_dates=["Date"], chunksize=chunksize)
+
 
 # ------------------------------
 # Task 2: Data Cleaning
 # ------------------------------
-df["Date"] = pd.to_datetime(df["Date"])
-df = df.dropna()
-df = df[["Date", "PM2.5", "PM10", "AQI", "NO2", "SO2"]]
+def clean_data(df):
+    """Parse dates, drop incomplete rows, keep pollutant columns, index by Date."""
+    df = df.copy()
+    df["Date"] = pd.to_datetime(df["Date"])
+    df = df.dropna()
+    df = df[COLUMNS]
+    return df.set_index("Date").sort_index()
+
 
 # ------------------------------
 # Task 3: Statistical Analysis
 # ------------------------------
-# Daily Data Already Given
-daily_avg = df[["PM2.5", "PM10"]].mean()
+def compute_stats(df):
+    """Daily / monthly PM averages and AQI min, max, std."""
+    return {
+        "daily_avg": df[["PM2.5", "PM10"]].mean(),
+        "monthly_avg": df.resample("ME")[["PM2.5", "PM10"]].mean(),
+        "aqi_min": df["AQI"].min(),
+        "aqi_max": df["AQI"].max(),
+        "aqi_std": df["AQI"].std(),
+    }
 
-# Monthly Aggregation
-df.set_index("Date", inplace=True)
-monthly_avg = df.resample("ME")[["PM2.5", "PM10"]].mean()
 
-aqi_min = df["AQI"].min()
-aqi_max = df["AQI"].max()
-aqi_std = df["AQI"].std()
+def print_stats(stats):
+    print("Monthly Average:")
+    print(stats["monthly_avg"])
+    print("AQI Min:", stats["aqi_min"])
+    print("AQI Max:", stats["aqi_max"])
+    print("AQI Std Dev:", stats["aqi_std"])
 
-print("Monthly Average:")
-print(monthly_avg)
-print("AQI Min:", aqi_min)
-print("AQI Max:", aqi_max)
-print("AQI Std Dev:", aqi_std)
 
 # ------------------------------
 # Task 4: Visualizations
 # ------------------------------
-plt.figure()
-plt.plot(df.index, df["AQI"])
-plt.title("Daily AQI Trend")
-plt.xlabel("Date")
-plt.ylabel("AQI")
-plt.savefig("daily_aqi.png")
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: indices of n_out points that keep the shape of (x, y).
+
+    The first and last points are always kept; from each bucket in between the
+    point forming the largest triangle with the previous pick and the next
+    bucket's average is chosen, so peaks and troughs survive downsampling.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    picked = np.empty(n_out, dtype=np.int64)
+    picked[0], picked[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo, nhi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        picked[i + 1] = a
+    return picked
+
+
+def downsample(series, max_points=MAX_PLOT_POINTS):
+    """Series reduced to at most max_points with LTTB (unchanged if already small)."""
+    if max_points is None or len(series) <= max_points:
+        return series
+    idx = lttb_indices(series.index.asi8 if isinstance(series.index, pd.DatetimeIndex) else series.index,
+                       series.to_numpy(), max_points)
+    return series.iloc[idx]
+
+
+def _draw_daily_aqi(fig, df, monthly_avg, max_points, hexbin_threshold):
+    ax = fig.subplots()
+    aqi = downsample(df["AQI"], max_points)
+    ax.plot(aqi.index, aqi)
+    ax.set_title("Daily AQI Trend")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("AQI")
+
+
+def _draw_monthly_pm25(fig, df, monthly_avg, max_points, hexbin_threshold):
+    ax = fig.subplots()
+    monthly_avg["PM2.5"].plot(kind="bar", ax=ax)
+    ax.set_title("Monthly Avg PM2.5")
+    ax.set_xlabel("Month")
+    ax.set_ylabel("PM2.5")
+
+
+def _draw_pm_scatter(fig, df, monthly_avg, max_points, hexbin_threshold):
+    ax = fig.subplots()
+    if len(df) > hexbin_threshold:
+        hb = ax.hexbin(df["PM2.5"], df["PM10"], gridsize=60, mincnt=1, cmap="viridis")
+        fig.colorbar(hb, ax=ax, label="Readings")
+    else:
+        ax.scatter(df["PM2.5"], df["PM10"])
+    ax.set_title("PM2.5 vs PM10 Scatter Plot")
+    ax.set_xlabel("PM2.5")
+    ax.set_ylabel("PM10")
+
+
+def _draw_subplot_pm(fig, df, monthly_avg, max_points, hexbin_threshold):
+    ax = fig.subplots(1, 2)
+    pm25 = downsample(df["PM2.5"], max_points)
+    ax[0].plot(pm25.index, pm25)
+    ax[0].set_title("Daily PM2.5")
+
+    pm10 = downsample(df["PM10"], max_points)
+    ax[1].plot(pm10.index, pm10)
+    ax[1].set_title("Daily PM10")
+
 
-plt.figure()
-monthly_avg["PM2.5"].plot(kind="bar")
-plt.title("Monthly Avg PM2.5")
-plt.xlabel("Month")
-plt.ylabel("PM2.5")
-plt.savefig("monthly_pm25.png")
+# chart name -> (draw function, figure size)
+CHARTS = {
+    "daily_aqi": (_draw_daily_aqi, None),
+    "monthly_pm25": (_draw_monthly_pm25, None),
+    "pm_scatter": (_draw_pm_scatter, None),
+    "subplot_pm": (_draw_subplot_pm, (10, 4)),
+}
 
-plt.figure()
-plt.scatter(df["PM2.5"], df["PM10"])
-plt.title("PM2.5 vs PM10 Scatter Plot")
-plt.xlabel("PM2.5")
-plt.ylabel("PM10")
-plt.savefig("pm_scatter.png")
 
-# Subplot
-fig, ax = plt.subplots(1, 2, figsize=(10, 4))
-ax[0].plot(df.index, df["PM2.5"])
-ax[0].set_title("Daily PM2.5")
+def plot_charts(df, monthly_avg, out_dir, max_points=MAX_PLOT_POINTS, hexbin_threshold=HEXBIN_THRESHOLD):
+    """Save the four assignment charts into out_dir; return {chart: ChartResult(path, seconds)}.
 
-ax[1].plot(df.index, df["PM10"])
-ax[1].set_title("Daily PM10")
+    Figures are built with the object API on the Agg backend (never registered
+    with pyplot) and cleared right after saving, so memory does not grow with
+    the number of stations. Line charts are downsampled to max_points and the
+    scatter becomes a hexbin above hexbin_threshold readings.
+    """
+    out_dir = Path(out_dir)
+    results = {}
+    for name, (draw, figsize) in CHARTS.items():
+        path = out_dir / CHART_FILES[name]
+        start = time.perf_counter()
+        fig = Figure(figsize=figsize)
+        try:
+            draw(fig, df, monthly_avg, max_points, hexbin_threshold)
+            fig.savefig(path)
+        finally:
+            fig.clear()
+        results[name] = ChartResult(path, time.perf_counter() - start)
+    return results
+
+
+def print_chart_timings(charts, station=None):
+    for name, result in charts.items():
+        label = f"{station}/{name}" if station else name
+        print(f"  {label:<30} {result.seconds * 1000:8.1f} ms  {result.path}")
 
-plt.savefig("subplot_pm.png")
 
 # ------------------------------
 # Task 5: Grouping
 # ------------------------------
-df["Month"] = df.index.month
-month_group = df.groupby("Month")[["PM2.5", "PM10", "AQI"]].mean()
-print(month_group)
+def group_by_month(df):
+    """Add a Month column and return calendar-month means of PM2.5, PM10, AQI."""
+    df["Month"] = df.index.month
+    return df.groupby("Month")[["PM2.5", "PM10", "AQI"]].mean()
+
 
 # ------------------------------
 # Task 6: Exporting
 # ------------------------------
-df.to_csv("cleaned_air_quality.csv")
+def export_cleaned(df, out_path):
+    df.to_csv(out_path)
+    return Path(out_path)
+
+
+# ------------------------------
+# Columnar Export (Parquet / Feather, needs pyarrow)
+# ------------------------------
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.dataset
+        import pyarrow.feather
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Columnar export needs pyarrow: pip install pyarrow") from e
+    return pyarrow
+
+
+def _path_segment(value):
+    """URI-escape a station name so names like "A/B" or ".." stay one folder under their root.
+
+    load_columnar's hive partitioning decodes it again (segment_encoding="uri").
+    """
+    return quote(str(value), safe="").replace(".", "%2E")
+
+
+def export_columnar(df, root, station, fmt="parquet", part=0, replace=False):
+    """Write cleaned rows (Date index) partitioned by station and month.
+
+    part names the file inside each month folder, so several writers (chunks
+    in streaming mode, input files in batch mode) can add to one station.
+    replace=True first removes whatever was previously exported for it.
+    """
+    pa = _pyarrow()
+    root = Path(root)
+    station_dir = root / f"Station={_path_segment(station)}"
+    if replace and station_dir.exists():
+        shutil.rmtree(station_dir)
+
+    data = df[POLLUTANTS].astype("float32").reset_index()
+    months = data["Date"].dt.strftime("%Y-%m")
+    for month, rows in data.groupby(months, sort=False):
+        folder = station_dir / f"Month={month}"
+        folder.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(rows, preserve_index=False)
+        path = folder / f"part-{part}.{fmt}"
+        if fmt == "parquet":
+            pa.parquet.write_table(table, path, compression=COLUMNAR_FORMATS[fmt])
+        else:
+            pa.feather.write_feather(table, path, compression=COLUMNAR_FORMATS[fmt])
+    return root
+
+
+def load_columnar(root, columns=None, start=None, end=None, stations=None):
+    """Read a columnar export back, touching only the requested columns and partitions.
+
+    start / end bound Date (inclusive); month partitions outside the range are
+    skipped without being opened. Returns a DataFrame indexed by Date.
+    """
+    pa = _pyarrow()
+    ds = pa.dataset
+    root = Path(root)
+    fmt = "ipc" if root.suffix == ".feather" else "parquet"
+    partitioning = ds.HivePartitioning(pa.schema([("Station", pa.string()), ("Month", pa.string())]),
+                                       segment_encoding="uri")
+    dataset = ds.dataset(root, format=fmt, partitioning=partitioning)
+
+    expr = None
+
+    def both(a, b):
+        return b if a is None else a & b
+
+    if start is not None:
+        start = pd.Timestamp(start)
+        expr = both(expr, (ds.field("Month") >= start.strftime("%Y-%m")) & (ds.field("Date") >= start))
+    if end is not None:
+        end = pd.Timestamp(end)
+        if end == end.normalize():
+            end = end + pd.Timedelta(days=1) - pd.Timedelta(1, "ns")  # whole end day
+        expr = both(expr, (ds.field("Month") <= end.strftime("%Y-%m")) & (ds.field("Date") <= end))
+    if stations is not None:
+        expr = both(expr, ds.field("Station").isin([str(s) for s in stations]))
+
+    wanted = ["Date"] + list(columns or POLLUTANTS) + ["Station"]
+    table = dataset.to_table(columns=list(dict.fromkeys(wanted)), filter=expr)
+    return table.to_pandas().set_index("Date").sort_index()
+
+
+# ------------------------------
+# Full Pipeline
+# ------------------------------
+def run_pipeline(input_path, out_dir=".", verbose=False, plots=True, quiet=False,
+                 max_points=MAX_PLOT_POINTS, columnar=None):
+    """Run load -> clean -> aggregate -> plot -> export for one input file."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    df = clean_data(load_data(input_path, verbose=verbose))
+    stats = compute_stats(df)
+    if not quiet:
+        print_stats(stats)
+
+    charts = plot_charts(df, stats["monthly_avg"], out_dir, max_points) if plots else {}
+    if charts and not quiet:
+        print("Charts:")
+        print_chart_timings(charts)
+
+    month_group = group_by_month(df)
+    if not quiet:
+        print(month_group)
+
+    cleaned = export_cleaned(df, out_dir / CLEANED_FILE)
+    if columnar:
+        export_columnar(df, out_dir / COLUMNAR_DIR.format(fmt=columnar), Path(input_path).stem, columnar,
+                        replace=True)
+    return {"df": df, "stats": stats, "month_group": month_group,
+            "charts": charts, "cleaned": cleaned}
+
+
+# ------------------------------
+# Streaming Mode (chunked, bounded memory)
+# ------------------------------
+class RunningAggregates:
+    """Fold cleaned chunks into per-day sums / counts and AQI extremes.
+
+    Memory is bounded by the number of distinct days, not the number of
+    readings; monthly figures are rolled up from the daily sums at the end.
+    """
+
+    def __init__(self):
+        self.daily_sum = None
+        self.daily_count = None
+        self.aqi_min = np.inf
+        self.aqi_max = -np.inf
+        self.aqi_sq_sum = 0.0
+        self.readings = 0
+
+    def update(self, chunk):
+        chunk = chunk.dropna(subset=COLUMNS)
+        if chunk.empty:
+            return
+        values = chunk[POLLUTANTS].astype("float64")
+        day = chunk["Date"].dt.normalize()
+        sums = values.groupby(day).sum()
+        counts = values.groupby(day).size()
+
+        if self.daily_sum is None:
+            self.daily_sum, self.daily_count = sums, counts
+        else:
+            self.daily_sum = self.daily_sum.add(sums, fill_value=0)
+            self.daily_count = self.daily_count.add(counts, fill_value=0)
+
+        aqi = values["AQI"].to_numpy()
+        self.aqi_min = min(self.aqi_min, aqi.min())
+        self.aqi_max = max(self.aqi_max, aqi.max())
+        self.aqi_sq_sum += float((aqi * aqi).sum())
+        self.readings += len(chunk)
+
+    def daily(self):
+        daily = self.daily_sum.div(self.daily_count, axis=0)
+        daily.index.name = "Date"
+        daily["Readings"] = self.daily_count.astype("int64")
+        return daily.sort_index()
+
+    def monthly(self):
+        sums = self.daily_sum.resample("ME").sum()
+        counts = self.daily_count.resample("ME").sum()
+        monthly = sums.div(counts, axis=0)[counts > 0]
+        monthly["Readings"] = counts[counts > 0].astype("int64")
+        return monthly
+
+    def calendar_months(self):
+        """Calendar-month means of PM2.5, PM10, AQI (same as group_by_month)."""
+        month = self.daily_sum.index.month
+        sums = self.daily_sum.groupby(month).sum()
+        counts = self.daily_count.groupby(month).sum()
+        calendar = sums.div(counts, axis=0)[["PM2.5", "PM10", "AQI"]]
+        calendar.index.name = "Month"
+        return calendar
+
+    def stats(self):
+        n = self.readings
+        aqi_sum = float(self.daily_sum["AQI"].sum())
+        variance = (self.aqi_sq_sum - aqi_sum * aqi_sum / n) / (n - 1) if n > 1 else np.nan
+        daily = self.daily()
+        return {
+            "daily_avg": (self.daily_sum[["PM2.5", "PM10"]].sum() / n),
+            "monthly_avg": self.monthly()[["PM2.5", "PM10"]],
+            "aqi_min": self.aqi_min,
+            "aqi_max": self.aqi_max,
+            "aqi_std": float(np.sqrt(max(variance, 0.0))),
+            "daily": daily,
+        }
+
+
+def stream_aggregate(path, chunksize=500_000, cleaned_path=None, columnar=None, columnar_root=None):
+    """Read path in typed chunks and fold them into RunningAggregates.
+
+    If cleaned_path is given, each cleaned chunk is appended to it as well, so
+    the cleaned export never needs the whole file in memory; columnar adds one
+    part file per chunk under columnar_root.
+    """
+    agg = RunningAggregates()
+    for n, chunk in enumerate(read_typed(path, chunksize=chunksize)):
+        agg.update(chunk)
+        if cleaned_path is None and not columnar:
+            continue
+        cleaned = chunk.dropna(subset=COLUMNS).set_index("Date")
+        if columnar:
+            export_columnar(cleaned, columnar_root, Path(path).stem, columnar, part=n, replace=n == 0)
+        if cleaned_path is not None:
+            cleaned["Month"] = cleaned.index.month
+            cleaned.to_csv(cleaned_path, mode="w" if n == 0 else "a", header=n == 0)
+    return agg
+
+
+def run_streaming(input_path, out_dir=".", chunksize=500_000, plots=True, quiet=False,
+                  max_points=MAX_PLOT_POINTS, columnar=None):
+    """Bounded-memory variant of run_pipeline for very large sensor exports."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    columnar_root = out_dir / COLUMNAR_DIR.format(fmt=columnar) if columnar else None
+    agg = stream_aggregate(input_path, chunksize, cleaned_path=out_dir / CLEANED_FILE,
+                           columnar=columnar, columnar_root=columnar_root)
+    if agg.readings == 0:
+        raise ValueError(f"No complete readings in {input_path}")
+    stats = agg.stats()
+    if not quiet:
+        print_stats(stats)
+
+    daily, monthly = stats["daily"], agg.monthly()
+    daily.to_csv(out_dir / DAILY_FILE)
+    monthly.to_csv(out_dir / MONTHLY_FILE)
+
+    # Charts are drawn from the daily means rather than every raw reading.
+    charts = plot_charts(daily, stats["monthly_avg"], out_dir, max_points) if plots else {}
+    if charts and not quiet:
+        print("Charts:")
+        print_chart_timings(charts)
+
+    month_group = agg.calendar_months()
+    if not quiet:
+        print(month_group)
+    return {"stats": stats, "daily": daily, "monthly": monthly, "month_group": month_group,
+            "charts": charts, "readings": agg.readings}
+
+
+# ------------------------------
+# Live Mode (replay a feed through the rolling statistics engine)
+# ------------------------------
+def replay_live(input_path, out_dir=".", chunksize=100_000, quiet=False, live=None):
+    """Feed readings one at a time into LiveAQIStats, writing every flag to anomalies.csv."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    live = live or LiveAQIStats()
+
+    readings = flagged = 0
+    with open(out_dir / ANOMALY_FILE, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Date", "Pollutant", "Value", "Flag", "Detail"])
+        for chunk in read_typed(input_path, chunksize=chunksize):
+            chunk = chunk.sort_values("Date")
+            for row in chunk[COLUMNS].itertuples(index=False, name=None):
+                reading = dict(zip(POLLUTANTS, row[1:]))
+                flags = live.update(row[0], reading)
+                readings += 1
+                for pollutant, kind, detail in flags:
+                    writer.writerow([row[0], pollutant, reading[pollutant], kind, detail])
+                flagged += bool(flags)
+
+    if not quiet:
+        print(f"Replayed {readings} readings, {flagged} flagged (see {out_dir / ANOMALY_FILE})")
+        print(pd.DataFrame(live.snapshot()).T.round(2))
+    return live
+
+
+# ------------------------------
+# Batch Mode (many stations, process pool)
+# ------------------------------
+def station_frames(path, shard_bytes=SHARD_BYTES):
+    """Split one input file into (station, source) shards for the worker pool.
+
+    A file without a Station column is a single station named after the file
+    and is passed on as its path. A file with one may hold many stations; it
+    is cut into FileRanges of about shard_bytes on line boundaries (station
+    None), so the workers parse it in parallel and split each range by
+    station themselves. Only the header and the cut points are read here.
+    """
+    path = Path(path)
+    with open(path, "rb") as f:
+        header = f.readline()
+        if "Station" not in next(csv.reader([header.decode("utf-8-sig")]), []):
+            yield path.stem, path
+            return
+        size = os.fstat(f.fileno()).st_size
+        start, n = f.tell(), 0
+        while start < size:
+            f.seek(min(start + shard_bytes, size))
+            f.readline()  # move the cut to the next line start
+            end = min(f.tell(), size)
+            yield None, FileRange(path, start, end, n)
+            start, n = end, n + 1
+
+
+def read_range(rng):
+    """Parse the rows of one FileRange with read_typed (Station column kept)."""
+    with open(rng.path, "rb") as f:
+        header = f.readline()
+        f.seek(rng.start)
+        body = f.read(rng.end - rng.start)
+    return read_typed(io.BytesIO(header + body), station=True)
+
+
+def daily_totals(df):
+    """Per-day pollutant sums plus a Readings count: means that can be merged across shards."""
+    grouped = df[POLLUTANTS].astype("float64").groupby(df.index.normalize())
+    totals = grouped.sum()
+    totals["Readings"] = grouped.size()
+    totals.index.name = "Date"
+    return totals
+
+
+def weighted_means(totals, keys):
+    """Add up totals rows sharing keys and divide by their Readings."""
+    sums = totals.groupby(keys, sort=True)[POLLUTANTS + ["Readings"]].sum()
+    means = sums[POLLUTANTS].div(sums["Readings"], axis=0)
+    means["Readings"] = sums["Readings"].astype("int64")
+    return means
+
+
+def process_station(station, raw, columnar=None, columnar_root=None, part=0):
+    """Worker task: clean one station shard and return its daily totals.
+
+    raw is the shard's rows, the path of a single-station file, or a
+    FileRange of a multi-station file, which is parsed here and split by
+    station (its columnar parts are named part-<part>-<range number>). With
+    columnar set the cleaned rows are also written to columnar_root as
+    part-<part>, so the cleaned frame never crosses processes.
+    """
+    if isinstance(raw, FileRange):
+        df = read_range(raw)
+        return pd.concat([process_station(str(name), rows.drop(columns="Station"), columnar, columnar_root,
+                                          f"{part}-{raw.n}")
+                          for name, rows in df.groupby("Station", sort=False, observed=True)],
+                         ignore_index=True)
+    if not isinstance(raw, pd.DataFrame):
+        raw = read_typed(raw)
+    df = clean_data(raw)
+    if columnar:
+        export_columnar(df, columnar_root, station, columnar, part=part)
+    totals = daily_totals(df).reset_index()
+    totals.insert(0, "Station", station)
+    return totals
+
+
+def render_station_charts(station, daily, monthly_avg, chart_dir, max_points=MAX_PLOT_POINTS):
+    """Worker task: draw one station's charts into chart_dir/<station>/; return timing rows."""
+    station_dir = Path(chart_dir) / _path_segment(station)
+    station_dir.mkdir(parents=True, exist_ok=True)
+    charts = plot_charts(daily, monthly_avg, station_dir, max_points)
+    return [(station, name, str(r.path), r.seconds) for name, r in charts.items()]
+
+
+def _bounded_map(pool, fn, arg_tuples, limit):
+    """Run fn(*args) for each tuple on pool with at most limit tasks in flight.
+
+    Unlike pool.map, the argument iterator is consumed only as tasks finish,
+    so shards are read while earlier ones are being processed. Results come
+    back in completion order.
+    """
+    pending, results = set(), []
+    for args in arg_tuples:
+        if len(pending) >= limit:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            results.extend(f.result() for f in done)
+        pending.add(pool.submit(fn, *args))
+    results.extend(f.result() for f in pending)
+    return results
+
+
+def _station_chart_tasks(totals, chart_dir, max_points):
+    """(station, daily means, monthly PM means, chart_dir, max_points) per station."""
+    for station, rows in totals.groupby("Station", sort=True):
+        rows = rows.set_index("Date")[POLLUTANTS + ["Readings"]]
+        daily = weighted_means(rows, "Date")
+        monthly = rows.resample("ME").sum()
+        monthly = monthly[monthly["Readings"] > 0]
+        monthly_avg = monthly[["PM2.5", "PM10"]].div(monthly["Readings"], axis=0)
+        yield station, daily, monthly_avg, chart_dir, max_points
+
+
+def run_batch(paths, out_dir=".", workers=None, quiet=False, charts=False, max_points=MAX_PLOT_POINTS,
+              columnar=None):
+    """Process many station files in worker processes and merge into station x month tables.
+
+    Single-station files are one task each and multi-station files are cut
+    into byte ranges that the workers parse and split by station, so one
+    export holding many stations still uses every worker. Workers return daily sums and counts, which are added up
+    per (Station, Month) here; a station split across several files therefore
+    gets one correctly weighted row per month.
+
+    charts=True also renders each station's charts (from its daily means) in
+    the workers and writes per-chart render times to chart_timings.csv.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    columnar_root = out_dir / COLUMNAR_DIR.format(fmt=columnar) if columnar else None
+    if columnar_root is not None and columnar_root.exists():
+        # Cleared once here; workers only add part files (a station may span several inputs).
+        shutil.rmtree(columnar_root)
+
+    shard_tasks = ((station, raw, columnar, columnar_root, part)
+                   for part, path in enumerate(paths) for station, raw in station_frames(path))
+    start = time.perf_counter()
+    chart_dir = out_dir / "charts"
+    with ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext() as pool:
+        def run(fn, tasks):
+            if pool is None:
+                return [fn(*args) for args in tasks]
+            return _bounded_map(pool, fn, tasks, 2 * workers)
+
+        shards = run(process_station, shard_tasks)
+        totals = pd.concat(shards, ignore_index=True)
+        months = totals["Date"].dt.to_period("M").rename("Month")
+        station_month = weighted_means(totals, ["Station", months]).reset_index()
+        calendar = totals["Date"].dt.month.rename("Month")
+        station_calendar = weighted_means(totals, ["Station", calendar]).drop(columns="Readings").reset_index()
+        elapsed = time.perf_counter() - start
+
+        timings = run(render_station_charts, _station_chart_tasks(totals, chart_dir, max_points)) if charts else []
+
+    station_month.to_csv(out_dir / STATION_MONTH_FILE, index=False)
+    station_calendar.to_csv(out_dir / STATION_CALENDAR_FILE, index=False)
+
+    chart_timings = pd.DataFrame([t for station_timings in timings for t in station_timings],
+                                 columns=["Station", "Chart", "Path", "Seconds"])
+    if charts:
+        chart_timings.to_csv(out_dir / CHART_TIMINGS_FILE, index=False)
+
+    readings = int(station_month["Readings"].sum())
+    stations = station_month["Station"].nunique()
+    if not quiet:
+        print(f"Processed {stations} stations ({len(shards)} shards) from {len(paths)} files "
+              f"({readings:,} readings) with {workers} workers in {elapsed:.2f}s "
+              f"({readings / elapsed:,.0f} readings/s)")
+        if charts:
+            per_chart = chart_timings.groupby("Chart")["Seconds"].agg(["count", "mean", "max"])
+            print(f"Rendered {len(chart_timings)} charts (see {out_dir / CHART_TIMINGS_FILE}):")
+            print((per_chart * [1, 1000, 1000]).rename(columns={"mean": "mean ms", "max": "max ms"}).round(1))
+    return {"station_month": station_month, "station_calendar": station_calendar,
+            "chart_timings": chart_timings, "seconds": elapsed, "readings": readings, "workers": workers}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Clean, analyse and plot air-quality CSV files.")
+    parser.add_argument("inputs", nargs="*", default=[str(DEFAULT_INPUT)],
+                        help="raw air-quality CSV file(s) (default: aqi_data.csv)")
+    parser.add_argument("-o", "--out-dir", default=".",
+                        help="output folder; with several inputs each gets a sub-folder named after the file")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print head / info / describe of the raw data")
+    parser.add_argument("-q", "--quiet", action="store_true", help="do not print statistics")
+    parser.add_argument("--no-plots", action="store_true", help="skip chart rendering")
+    parser.add_argument("--max-points", type=int, default=MAX_PLOT_POINTS,
+                        help=f"point budget for line charts (default: {MAX_PLOT_POINTS})")
+    parser.add_argument("--columnar", choices=sorted(COLUMNAR_FORMATS),
+                        help="also export cleaned data as Parquet / Feather partitioned by station and month")
+    parser.add_argument("--batch", action="store_true",
+                        help="multi-station mode: aggregate all inputs in parallel into station x month tables")
+    parser.add_argument("--chunksize", type=int, default=None,
+                        help="streaming mode: read inputs in chunks of this many rows (bounded memory)")
+    parser.add_argument("--live", action="store_true",
+                        help="replay inputs through the live rolling-statistics engine and write anomalies.csv")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="worker processes for --batch (default: CPU count)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.batch:
+        run_batch(args.inputs, args.out_dir, workers=args.workers, quiet=args.quiet,
+                  charts=not args.no_plots, max_points=args.max_points, columnar=args.columnar)
+        return
+
+    many = len(args.inputs) > 1
+    for path in args.inputs:
+        out_dir = Path(args.out_dir) / Path(path).stem if many else Path(args.out_dir)
+        if many and not args.quiet:
+            print(f"\n=== {path} ===")
+        if args.live:
+            replay_live(path, out_dir, chunksize=args.chunksize or 100_000, quiet=args.quiet)
+        elif args.chunksize:
+            run_streaming(path, out_dir, chunksize=args.chunksize, plots=not args.no_plots, quiet=args.quiet,
+                          max_points=args.max_points, columnar=args.columnar)
+        else:
+            run_pipeline(path, out_dir, verbose=args.verbose, plots=not args.no_plots, quiet=args.quiet,
+                         max_points=args.max_points, columnar=args.columnar)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# ------------------------------
+# AQI Time Index
+#
+# Precomputed lookup layer over cleaned air-quality data: per-station sorted
+# timestamp arrays (binary-search range slicing) and cumulative-sum tables,
+# so the mean of any pollutant over any date range costs two searchsorted
+# calls and a subtraction - independent of how long the dataset is.
+#
+# Usage:
+#   index = AQITimeIndex.from_frame(clean_data(load_data("aqi_data.csv")))
+#   index.range_mean("2024-01-10", "2024-01-20")
+#   index.month_mean(2024, 2)["PM2.5"]
+#   index.season_mean(2024, "Winter", station="Delhi")
+# ------------------------------
+import numpy as np
+import pandas as pd
+
+POLLUTANTS = ["PM2.5", "PM10", "AQI", "NO2", "SO2"]
+DEFAULT_STATION = "all"
+
+# Indian meteorological seasons. Winter of year Y runs from December of Y-1
+# through February of Y.
+SEASONS = {
+    "Winter": (12, 2),
+    "Summer": (3, 5),
+    "Monsoon": (6, 9),
+    "Post-monsoon": (10, 11),
+}
+
+
+def _bounds(start, end):
+    """Inclusive [start, end] as int64 ns; a date-only end covers that whole day."""
+    start = pd.Timestamp(start)
+    end = pd.Timestamp(end)
+    if end == end.normalize():
+        end = end + pd.Timedelta(days=1) - pd.Timedelta(1, "ns")
+    return start.value, end.value
+
+
+class StationSeries:
+    """Sorted timestamps and prefix sums for one station."""
+
+    def __init__(self, times, values, columns):
+        order = np.argsort(times, kind="stable")
+        self.times = np.asarray(times, dtype="int64")[order]
+        self.values = np.asarray(values, dtype="float64")[order]
+        self.columns = list(columns)
+        # cumsum[i] = sum of the first i readings (row 0 is zeros).
+        self.cumsum = np.zeros((len(self.times) + 1, len(self.columns)))
+        np.cumsum(self.values, axis=0, out=self.cumsum[1:])
+
+    def locate(self, start_ns, end_ns):
+        lo = np.searchsorted(self.times, start_ns, side="left")
+        hi = np.searchsorted(self.times, end_ns, side="right")
+        return lo, hi
+
+
+class AQITimeIndex:
+    """Range and calendar queries over cleaned AQI readings in O(log n)."""
+
+    def __init__(self, stations):
+        self.stations = stations
+
+    @classmethod
+    def from_frame(cls, df, columns=None):
+        """Build from a cleaned DataFrame indexed by Date (optional Station column)."""
+        columns = [c for c in (columns or POLLUTANTS) if c in df.columns]
+        if "Station" in df.columns:
+            groups = df.groupby("Station", sort=False, observed=True)
+        else:
+            groups = [(DEFAULT_STATION, df)]
+        stations = {}
+        for station, rows in groups:
+            times = pd.DatetimeIndex(rows.index).as_unit("ns").asi8
+            stations[str(station)] = StationSeries(times, rows[columns].to_numpy(), columns)
+        return cls(stations)
+
+    def _series(self, station):
+        if station is None:
+            if len(self.stations) != 1:
+                raise ValueError(f"Several stations indexed; choose one of {sorted(self.stations)}")
+            return next(iter(self.stations.values()))
+        return self.stations[str(station)]
+
+    # ------------------------------
+    # Range queries
+    # ------------------------------
+    def count(self, start, end, station=None):
+        s = self._series(station)
+        lo, hi = s.locate(*_bounds(start, end))
+        return int(hi - lo)
+
+    def range_slice(self, start, end, station=None):
+        """Readings in [start, end] as a DataFrame; only that slice is copied."""
+        s = self._series(station)
+        lo, hi = s.locate(*_bounds(start, end))
+        return pd.DataFrame(s.values[lo:hi], columns=s.columns,
+                            index=pd.DatetimeIndex(s.times[lo:hi], name="Date"))
+
+    def range_mean(self, start, end, station=None):
+        """{pollutant: mean} over [start, end] from the prefix sums (NaN if empty)."""
+        s = self._series(station)
+        lo, hi = s.locate(*_bounds(start, end))
+        n = hi - lo
+        if n == 0:
+            return dict.fromkeys(s.columns, np.nan)
+        sums = s.cumsum[hi] - s.cumsum[lo]
+        return dict(zip(s.columns, (sums / n).tolist()))
+
+    # ------------------------------
+    # Calendar queries
+    # ------------------------------
+    def month_mean(self, year, month, station=None):
+        first = pd.Timestamp(year=year, month=month, day=1)
+        return self.range_mean(first, first + pd.offsets.MonthEnd(0), station)
+
+    def week_mean(self, year, week, station=None):
+        """ISO week (Monday to Sunday)."""
+        monday = pd.Timestamp.fromisocalendar(year, week, 1)
+        return self.range_mean(monday, monday + pd.Timedelta(days=6), station)
+
+    def season_mean(self, year, season, station=None):
+        first_month, last_month = SEASONS[season]
+        start_year = year - 1 if first_month > last_month else year
+        start = pd.Timestamp(year=start_year, month=first_month, day=1)
+        end = pd.Timestamp(year=year, month=last_month, day=1) + pd.offsets.MonthEnd(0)
+        return self.range_mean(start, end, station)
@@ -0,0 +1,172 @@
+# ------------------------------
+# Live AQI Statistics
+#
+# Incremental rolling statistics and anomaly flags for a feed of readings
+# with the same pollutant columns as aqi_data.csv. Every update is O(1)
+# (amortised), so a dashboard can refresh after each reading without
+# recomputing from the start of the dataset. Pure Python: no pandas needed.
+#
+# Usage:
+#   live = LiveAQIStats()
+#   flags = live.update(timestamp, {"PM2.5": 140, "PM10": 210, "AQI": 320, ...})
+#   live.snapshot()
+# ------------------------------
+import math
+from collections import deque
+from datetime import datetime, timedelta
+
+POLLUTANTS = ["PM2.5", "PM10", "AQI", "NO2", "SO2"]
+
+# Readings above these levels are flagged regardless of recent history
+# (24-hour limits from India's NAAQS for pollutants; "Very Poor" for AQI).
+DEFAULT_THRESHOLDS = {"PM2.5": 60, "PM10": 100, "AQI": 300, "NO2": 80, "SO2": 80}
+
+DEFAULT_WINDOWS = {"24h": timedelta(hours=24), "7d": timedelta(days=7)}
+
+
+def _seconds(ts):
+    if isinstance(ts, (int, float)):
+        return float(ts)
+    if isinstance(ts, str):
+        ts = datetime.fromisoformat(ts)
+    return ts.timestamp()
+
+
+# ------------------------------
+# Rolling Window (time based)
+# ------------------------------
+class RollingWindow:
+    """Mean / std over the readings of the last `span` of time.
+
+    Keeps running sums of x and x^2; each reading is appended once and evicted
+    once, so updates are amortised O(1).
+    """
+
+    def __init__(self, span):
+        self.span = span.total_seconds() if isinstance(span, timedelta) else float(span)
+        self.items = deque()
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def expire(self, now):
+        """Drop readings older than span before now."""
+        cutoff = now - self.span
+        while self.items and self.items[0][0] <= cutoff:
+            _, x = self.items.popleft()
+            self.total -= x
+            self.total_sq -= x * x
+        if not self.items:
+            # Reset drift from repeated add / subtract.
+            self.total = self.total_sq = 0.0
+
+    def add(self, t, x):
+        self.expire(t)
+        self.items.append((t, x))
+        self.total += x
+        self.total_sq += x * x
+
+    @property
+    def count(self):
+        return len(self.items)
+
+    @property
+    def mean(self):
+        return self.total / len(self.items) if self.items else math.nan
+
+    @property
+    def std(self):
+        n = len(self.items)
+        if n < 2:
+            return math.nan
+        var = (self.total_sq - self.total * self.total / n) / (n - 1)
+        return math.sqrt(max(var, 0.0))
+
+
+# ------------------------------
+# Exponentially Weighted Mean (time aware)
+# ------------------------------
+class EWMA:
+    """EWMA whose decay depends on the time gap, so irregular feeds weigh correctly."""
+
+    def __init__(self, halflife):
+        self.halflife = halflife.total_seconds() if isinstance(halflife, timedelta) else float(halflife)
+        self.value = math.nan
+        self.last = None
+
+    def add(self, t, x):
+        if self.last is None:
+            self.value = x
+        else:
+            alpha = 1 - 0.5 ** (max(t - self.last, 0.0) / self.halflife)
+            self.value += alpha * (x - self.value)
+        self.last = t
+        return self.value
+
+
+# ------------------------------
+# Live Statistics Engine
+# ------------------------------
+class LiveAQIStats:
+    """Rolling means / std, EWMA and anomaly flags for each pollutant.
+
+    A reading is flagged when it exceeds its threshold, or when it is more than
+    z_limit standard deviations from the mean of the first window (24h by
+    default) once that window holds at least min_periods readings.
+    """
+
+    def __init__(self, windows=None, halflife=timedelta(hours=6), thresholds=None,
+                 z_limit=3.0, min_periods=12, pollutants=POLLUTANTS):
+        self.windows = windows or DEFAULT_WINDOWS
+        self.thresholds = DEFAULT_THRESHOLDS if thresholds is None else thresholds
+        self.z_limit = z_limit
+        self.min_periods = min_periods
+        self.pollutants = list(pollutants)
+        self.z_window = next(iter(self.windows))
+
+        self.rolling = {p: {name: RollingWindow(span) for name, span in self.windows.items()}
+                        for p in self.pollutants}
+        self.ewma = {p: EWMA(halflife) for p in self.pollutants}
+        self.latest = {}
+        self.last_time = None
+
+    def update(self, timestamp, reading):
+        """Add one reading ({pollutant: value}); return a list of (pollutant, kind, detail) flags."""
+        t = _seconds(timestamp)
+        flags = []
+        for p in self.pollutants:
+            x = reading.get(p)
+            if x is None or x != x:  # missing or NaN
+                continue
+            x = float(x)
+
+            ref = self.rolling[p][self.z_window]
+            ref.expire(t)
+            if ref.count >= self.min_periods:
+                std = ref.std
+                if std and std > 0:
+                    z = (x - ref.mean) / std
+                    if abs(z) > self.z_limit:
+                        flags.append((p, "zscore", round(z, 2)))
+
+            limit = self.thresholds.get(p)
+            if limit is not None and x > limit:
+                flags.append((p, "threshold", limit))
+
+            for window in self.rolling[p].values():
+                window.add(t, x)
+            self.ewma[p].add(t, x)
+            self.latest[p] = x
+
+        self.last_time = t
+        return flags
+
+    def snapshot(self):
+        """Current value, rolling mean / std per window and EWMA for each pollutant."""
+        snap = {}
+        for p in self.pollutants:
+            row = {"value": self.latest.get(p, math.nan), "ewma": self.ewma[p].value}
+            for name, window in self.rolling[p].items():
+                row[f"mean_{name}"] = window.mean
+                row[f"std_{name}"] = window.std
+            snap[p] = row
+        return snap